@@ -14,23 +14,58 @@ Usage:
     telemetry-analyze.py --data-dir /path/to/events
 """
 
+from __future__ import annotations
+
 import argparse
+import functools
+import importlib.util
 import json
+import math
+import numbers
+import os
+import string
 import sys
-import warnings
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
-import pandas as pd
+# pandas/numpy are imported on first use (see import_dataframe_libs()), so
+# --help and argument errors don't pay for importing them
+np: Any = None
+pd: Any = None
+
+
+def import_dataframe_libs() -> None:
+    """Import numpy and pandas into the module globals, once."""
+    global np, pd
+    if pd is None:
+        import numpy
+        import pandas
+
+        np, pd = numpy, pandas
+
 
-# Suppress pandas timezone-to-period conversion warnings (expected behavior)
-warnings.filterwarnings("ignore", message="Converting to PeriodArray")
+# orjson is optional - parses event files several times faster than json
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# pyarrow is optional - Arrow-backed strings hash device ids faster, and
+# --engine arrow flattens events in Arrow instead of json_normalize. Only
+# probed here; it is imported where used.
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
 
 
 def bucket_value(value, buckets: list[tuple[float, float, str]]) -> str:
     """Place a value into a labeled bucket."""
-    if value is None or pd.isna(value):
+    if value is None or (
+        isinstance(value, numbers.Real) and math.isnan(value)
+    ):
         return "unknown"
     for low, high, label in buckets:
         if low <= value < high:
@@ -38,6 +73,201 @@ def bucket_value(value, buckets: list[tuple[float, float, str]]) -> str:
     return "unknown"
 
 
+def bucket_bins(
+    buckets: list[tuple[float, float, str]],
+) -> tuple[list[float], list[str]]:
+    """Convert a contiguous bucket table into sorted edges and labels."""
+    edges = [float(low) for low, _, _ in buckets] + [float(buckets[-1][1])]
+    labels = [label for _, _, label in buckets]
+    return edges, labels
+
+
+def bucket_counts(
+    values: pd.Series, edges: list[float], labels: list[str]
+) -> dict:
+    """Vectorized bucket_value() over a Series, returned as value counts.
+
+    Bucket lookup is a binary search over the edges; NaN and values outside
+    [edges[0], edges[-1]) are counted as "unknown".
+    """
+    import_dataframe_libs()
+    arr = pd.to_numeric(values, errors="coerce").to_numpy(
+        dtype=np.float64, na_value=np.nan
+    )
+    idx = np.searchsorted(np.asarray(edges), arr, side="right") - 1
+    unknown = len(labels)
+    idx[(idx < 0) | (idx >= unknown) | np.isnan(arr)] = unknown
+    present, first = np.unique(idx, return_index=True)
+    counts = np.bincount(idx, minlength=unknown + 1)[present]
+    # Largest first, ties in order of first appearance, as value_counts()
+    # orders them
+    order = np.lexsort((first, -counts))
+    names = labels + ["unknown"]
+    return {names[present[i]]: int(counts[i]) for i in order}
+
+
+def flatten_events_arrow(events: list[dict]) -> Optional[pd.DataFrame]:
+    """Flatten events one level deep via Arrow, like pd.json_normalize().
+
+    Returns None if Arrow can't infer a single schema for the events (e.g.
+    a field holds an int in one event and a string in another).
+    """
+    import pyarrow as pa
+
+    import_dataframe_libs()
+    try:
+        table = pa.Table.from_struct_array(pa.array(events)).flatten()
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+    columns = {}
+    for name, col in zip(table.column_names, table.columns):
+        # Lists and deeper sections stay Python objects, as json_normalize
+        # leaves them
+        if pa.types.is_nested(col.type):
+            columns[name] = col.to_pylist()
+        else:
+            columns[name] = col.to_pandas()
+    return pd.DataFrame(columns)
+
+
+def mean_max_p95(
+    frame: pd.DataFrame,
+) -> dict[str, tuple[np.float64, np.float64, np.float64]]:
+    """Per-column mean, max and linear 95th percentile, ignoring NaN.
+
+    The columns are stacked into one (rows, columns) float64 array and each
+    statistic is a single axis-0 reduction over it. Columns with no
+    non-null values are left out.
+    """
+    import_dataframe_libs()
+    # load_events() already casts the NUMERIC_COLUMNS; only other columns
+    # take a to_numeric() pass
+    coerce = {
+        c: pd.to_numeric(frame[c], errors="coerce")
+        for c, dtype in frame.dtypes.items()
+        if not pd.api.types.is_numeric_dtype(dtype)
+    }
+    if coerce:
+        frame = frame.assign(**coerce)
+    arr = frame.to_numpy(dtype=np.float64, na_value=np.nan)
+    has_data = ~np.isnan(arr).all(axis=0)
+    arr = arr[:, has_data]
+    if arr.shape[1] == 0:
+        return {}
+    means = np.nanmean(arr, axis=0)
+    maxes = np.nanmax(arr, axis=0)
+    p95s = np.nanquantile(arr, 0.95, axis=0)
+    return {
+        col: (means[i], maxes[i], p95s[i])
+        for i, col in enumerate(frame.columns[has_data])
+    }
+
+
+# Metric keys reported at a precision other than round_floats()'s default
+# one place. A listed key's precision covers everything nested under it.
+METRIC_PRECISION = {
+    "crash_rate": 4,
+    "crash_rate_per_version": 4,
+    "connect_count_mean": 2,
+    "disconnect_count_mean": 2,
+    "klippy_error_count_mean": 2,
+    "klippy_shutdown_count_mean": 2,
+}
+
+
+def round_floats(
+    obj: Any, ndigits: int = 1, precision: dict[str, int] = METRIC_PRECISION
+) -> Any:
+    """Round every float in a nested metrics dict in one pass.
+
+    Floats are rounded to ndigits places, or to precision[key] under a key
+    listed there. numpy float scalars come back as Python floats.
+    """
+    import_dataframe_libs()
+    return _round_floats(obj, ndigits, precision)
+
+
+def _round_floats(obj: Any, ndigits: int, precision: dict[str, int]) -> Any:
+    if isinstance(obj, dict):
+        return {
+            k: _round_floats(v, precision.get(k, ndigits), precision)
+            for k, v in obj.items()
+        }
+    if isinstance(obj, list):
+        return [_round_floats(v, ndigits, precision) for v in obj]
+    if isinstance(obj, (float, np.floating)):
+        return round(float(obj), ndigits)
+    return obj
+
+
+def _json_key(key: Any) -> str:
+    """Dict key as json.dumps() would write it."""
+    if isinstance(key, str):
+        return key
+    if key is None or isinstance(key, (bool, np.bool_)):
+        return json.dumps(None if key is None else bool(key))
+    if isinstance(key, numbers.Integral):
+        return str(int(key))
+    if isinstance(key, numbers.Real):
+        return repr(float(key))
+    return str(key)
+
+
+def json_ready(obj: Any) -> Any:
+    """Convert a metrics dict to plain JSON types ahead of serialization.
+
+    Keys become strings, numpy scalars become Python numbers, NaN and
+    infinities become None, and any other type becomes its str(), so the
+    orjson and json encoders produce the same document.
+    """
+    import_dataframe_libs()
+    return _json_ready(obj)
+
+
+def _json_ready(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return {_json_key(k): _json_ready(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_json_ready(v) for v in obj]
+    if obj is None or isinstance(obj, str):
+        return obj
+    if isinstance(obj, (bool, np.bool_)):
+        return bool(obj)
+    if isinstance(obj, numbers.Integral):
+        return int(obj)
+    if isinstance(obj, numbers.Real):
+        value = float(obj)
+        return value if math.isfinite(value) else None
+    return str(obj)
+
+
+def rounded_metrics(method):
+    """Run a compute_*_metrics() result through round_floats().
+
+    pandas is imported first, since the frames may have been assigned
+    directly instead of by load_events().
+    """
+
+    @functools.wraps(method)
+    def wrapper(self) -> dict:
+        import_dataframe_libs()
+        return round_floats(method(self))
+
+    return wrapper
+
+
+def read_event_file(fpath: Path) -> tuple[Any, Optional[Exception]]:
+    """Read and parse one event file, returning (data, error)."""
+    try:
+        with open(fpath, "rb") as f:
+            raw = f.read()
+        if ORJSON_AVAILABLE:
+            return orjson.loads(raw), None
+        return json.loads(raw), None
+    except (json.JSONDecodeError, OSError) as e:
+        return None, e
+
+
 RAM_BUCKETS = [
     (0, 512, "<512MB"),
     (512, 1024, "512MB-1GB"),
@@ -46,6 +276,7 @@ RAM_BUCKETS = [
     (4096, 8192, "4-8GB"),
     (8192, float("inf"), "8GB+"),
 ]
+RAM_EDGES, RAM_LABELS = bucket_bins(RAM_BUCKETS)
 
 NOZZLE_TEMP_BUCKETS = [
     (0, 180, "<180C"),
@@ -56,6 +287,7 @@ NOZZLE_TEMP_BUCKETS = [
     (280, 310, "280-310C"),
     (310, float("inf"), "310C+"),
 ]
+NOZZLE_TEMP_EDGES, NOZZLE_TEMP_LABELS = bucket_bins(NOZZLE_TEMP_BUCKETS)
 
 BED_TEMP_BUCKETS = [
     (0, 40, "<40C"),
@@ -65,6 +297,7 @@ BED_TEMP_BUCKETS = [
     (100, 120, "100-120C"),
     (120, float("inf"), "120C+"),
 ]
+BED_TEMP_EDGES, BED_TEMP_LABELS = bucket_bins(BED_TEMP_BUCKETS)
 
 UPTIME_BUCKETS = [
     (0, 60, "<1min"),
@@ -74,37 +307,627 @@ UPTIME_BUCKETS = [
     (3600, 14400, "1-4hr"),
     (14400, float("inf"), "4hr+"),
 ]
+UPTIME_EDGES, UPTIME_LABELS = bucket_bins(UPTIME_BUCKETS)
+
+# Fields kept per event type: (scalar fields, nested sections). Nested
+# sections are flattened to "section.field" columns.
+BASE_FIELDS = ("event", "device_id", "timestamp", "schema_version")
+EVENT_SCHEMA: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    "session": (("features",), ("app", "host", "printer")),
+    "print_outcome": (
+        (
+            "outcome",
+            "duration_sec",
+            "phases_completed",
+            "filament_used_mm",
+            "filament_type",
+            "nozzle_temp",
+            "bed_temp",
+        ),
+        (),
+    ),
+    "crash": (
+        ("signal", "signal_name", "app_version", "uptime_sec", "backtrace"),
+        (),
+    ),
+    "update_failed": (
+        (
+            "reason",
+            "version",
+            "from_version",
+            "platform",
+            "http_code",
+            "file_size",
+            "exit_code",
+        ),
+        (),
+    ),
+    "update_success": (("version", "from_version", "platform"), ()),
+    "memory_snapshot": (
+        (
+            "trigger",
+            "uptime_sec",
+            "rss_kb",
+            "vm_size_kb",
+            "vm_data_kb",
+            "vm_swap_kb",
+            "vm_peak_kb",
+            "vm_hwm_kb",
+        ),
+        (),
+    ),
+    "hardware_profile": (
+        ("display_backend",),
+        (
+            "printer",
+            "mcus",
+            "build_volume",
+            "extruders",
+            "fans",
+            "steppers",
+            "leds",
+            "sensors",
+            "probe",
+            "capabilities",
+            "ams",
+            "tools",
+            "macros",
+            "plugins",
+        ),
+    ),
+    "settings_snapshot": (
+        (
+            "theme",
+            "brightness_pct",
+            "screensaver_timeout_sec",
+            "screen_blank_timeout_sec",
+            "locale",
+            "sound_enabled",
+            "auto_update_channel",
+            "animations_enabled",
+            "time_format",
+        ),
+        (),
+    ),
+    "panel_usage": (
+        ("session_duration_sec", "overlay_open_count"),
+        ("panel_time_sec", "panel_visits"),
+    ),
+    "connection_stability": (
+        (
+            "session_duration_sec",
+            "connect_count",
+            "disconnect_count",
+            "total_connected_sec",
+            "total_disconnected_sec",
+            "longest_disconnect_sec",
+            "klippy_error_count",
+            "klippy_shutdown_count",
+        ),
+        (),
+    ),
+    "print_start_context": (
+        (
+            "source",
+            "has_thumbnail",
+            "file_size_bucket",
+            "estimated_duration_bucket",
+            "slicer",
+            "tool_count_used",
+            "ams_active",
+        ),
+        (),
+    ),
+    "error_encountered": (("category", "code", "context", "uptime_sec"), ()),
+}
+SCHEMA_FIELDS = frozenset(BASE_FIELDS).union(
+    *(scalars for scalars, _ in EVENT_SCHEMA.values())
+)
+SCHEMA_SECTIONS = frozenset().union(
+    *(sections for _, sections in EVENT_SCHEMA.values())
+)
+
+
+def in_schema(column: str) -> bool:
+    """True if a flattened column is declared by some EVENT_SCHEMA entry."""
+    section, dot, _ = column.partition(".")
+    if column in SCHEMA_FIELDS:
+        return True
+    return bool(dot) and section in SCHEMA_SECTIONS
+
+
+# Derived calendar keys carried on every per-type frame
+CALENDAR_COLUMNS = ("_date", "_week", "_month")
+
+# "_week" holds whole weeks since this Monday, so ISO weeks (Monday start)
+# are plain int32 arithmetic; they get "YYYY-Www" labels only when emitted
+EPOCH_MONDAY = "1969-12-29T00:00:00Z"
+
+
+def iso_week_labels(counts: pd.Series) -> dict:
+    """Re-key a Series indexed by "_week" number with ISO week labels."""
+    import_dataframe_libs()
+    weeks = pd.to_timedelta(counts.index.astype("int64") * 7, "D")
+    labels = (pd.Timestamp(EPOCH_MONDAY) + weeks).strftime("%G-W%V")
+    return dict(zip(labels, counts.tolist()))
+
+
+def event_columns(columns, event: str) -> list[str]:
+    """Columns of a flattened frame that belong to one event type."""
+    scalars, sections = EVENT_SCHEMA.get(event, ((), ()))
+    keep = set(BASE_FIELDS) | set(CALENDAR_COLUMNS) | set(scalars)
+    return [
+        c
+        for c in columns
+        if c in keep or ("." in c and c.split(".", 1)[0] in sections)
+    ]
+
+
+# Boolean flags reported as percentages, stored as nullable "boolean" so
+# the true count is a count_nonzero over a packed bool array
+BOOLEAN_COLUMNS = (
+    "has_thumbnail",
+    "ams_active",
+    "capabilities.has_chamber",
+    "capabilities.has_accelerometer",
+    "capabilities.has_firmware_retraction",
+    "capabilities.has_exclude_object",
+    "capabilities.has_timelapse",
+    "capabilities.has_klippain_shaketune",
+    "probe.has_probe",
+    "probe.has_bed_mesh",
+    "probe.has_qgl",
+)
+
+# Numeric payload fields, coerced once at load so metric passes don't
+# re-parse them. float32 is used for fields that are only bucketed or
+# counted; fields whose mean/sum/max is reported stay float64 so those
+# stats keep full precision and serialize as plain JSON numbers.
+NUMERIC_COLUMNS = {
+    "host.ram_total_mb": "float32",
+    "phases_completed": "float32",
+    "nozzle_temp": "float32",
+    "bed_temp": "float32",
+    "duration_sec": "float64",
+    "filament_used_mm": "float64",
+    "uptime_sec": "float64",
+    "rss_kb": "float64",
+    "vm_size_kb": "float64",
+    "vm_data_kb": "float64",
+    "vm_swap_kb": "float64",
+    "vm_peak_kb": "float64",
+    "vm_hwm_kb": "float64",
+    "brightness_pct": "float64",
+    "session_duration_sec": "float64",
+    "connect_count": "float64",
+    "disconnect_count": "float64",
+    "total_connected_sec": "float64",
+    "total_disconnected_sec": "float64",
+    "longest_disconnect_sec": "float64",
+    "klippy_error_count": "float64",
+    "klippy_shutdown_count": "float64",
+}
+
+# Low-cardinality fields per event type; stored as category so
+# value_counts() counts integer codes instead of hashing each string.
+# Categories come from each per-type frame, so none start out unobserved.
+SESSION_CATEGORY_COLUMNS = (
+    "app.platform",
+    "app.version",
+    "printer.detected_model",
+    "printer.kinematics",
+    "app.display",
+    "app.locale",
+    "app.theme",
+    "printer.klipper_version",
+    "host.arch",
+)
+CATEGORY_COLUMNS: dict[str, tuple[str, ...]] = {
+    "session": SESSION_CATEGORY_COLUMNS,
+    "print_outcome": ("filament_type",),
+    "hardware_profile": (
+        "printer.detected_model",
+        "printer.kinematics",
+        "mcus.primary",
+        "ams.type",
+        "display_backend",
+    ),
+    "settings_snapshot": ("theme", "locale", "time_format"),
+    "print_start_context": (
+        "source",
+        "slicer",
+        "file_size_bucket",
+        "estimated_duration_bucket",
+    ),
+    "error_encountered": ("category", "code", "context"),
+}
+
+# High-cardinality or free-form string fields, stored as Arrow strings when
+# pyarrow is installed so value_counts() and equality filters run in Arrow
+# kernels instead of over Python str objects
+ARROW_STRING_COLUMNS = (
+    "device_id",
+    "outcome",
+    "signal_name",
+    "app_version",
+    "reason",
+    "version",
+    "from_version",
+    "platform",
+)
+
+
+def appearance_categories(values: pd.Series) -> pd.CategoricalDtype:
+    """Category dtype ordered by first appearance, not sorted.
+
+    value_counts() breaks count ties by category order, so this keeps the
+    same tie order an object column would give.
+    """
+    import_dataframe_libs()
+    return pd.CategoricalDtype(pd.unique(values.dropna()))
+
+
+# Per-type frame attributes reported in event_counts, in report order
+EVENT_COUNT_FRAMES = (
+    "sessions",
+    "prints",
+    "crashes",
+    "update_failures",
+    "update_successes",
+    "memory_snapshots",
+    "hardware_profiles",
+    "settings_snapshots",
+    "panel_usage",
+    "connection_stability",
+    "print_starts",
+    "errors",
+)
+
+
+# compute_all() result key -> TelemetryAnalyzer method, in report order
+METRIC_FAMILIES = {
+    "adoption": "compute_adoption_metrics",
+    "print_reliability": "compute_print_metrics",
+    "crash_analysis": "compute_crash_metrics",
+    "update_analysis": "compute_update_metrics",
+    "memory_analysis": "compute_memory_metrics",
+    "hardware_analysis": "compute_hardware_metrics",
+    "settings_analysis": "compute_settings_metrics",
+    "panel_usage_analysis": "compute_panel_usage_metrics",
+    "connection_analysis": "compute_connection_metrics",
+    "print_start_analysis": "compute_print_start_metrics",
+    "error_analysis": "compute_error_metrics",
+}
+
+
+class _ZeroDefault(dict):
+    """format_map() mapping that renders missing metrics as 0."""
+
+    def __missing__(self, key: str) -> int:
+        return 0
+
+
+def fmt_ratio(value: Optional[float]) -> str:
+    """Format a ratio as a percentage, or N/A when missing."""
+    return f"{value:.2%}" if value is not None else "N/A"
+
+
+def fmt_duration(seconds: float) -> str:
+    """Format seconds as a short s/min/hr duration."""
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    if seconds < 3600:
+        return f"{seconds / 60:.1f}min"
+    return f"{seconds / 3600:.1f}hr"
+
+
+@dataclass(frozen=True)
+class ReportSection:
+    """One block of the terminal report.
+
+    rows are (kind, *args) tuples rendered in order by
+    TelemetryAnalyzer._render_section(). Value converters are given as
+    functions, so a bad name fails at import rather than at render.
+    Sections with show_note print their header and note when there is no
+    data; others are skipped.
+    """
+
+    key: str
+    title: str
+    rows: tuple[tuple, ...]
+    show_note: bool = False
+
+
+REPORT_SECTIONS = (
+    ReportSection(
+        "adoption",
+        "ADOPTION METRICS",
+        (
+            ("line", "  Total unique devices: {total_unique_devices}"),
+            ("dist", "Platform", "platform_distribution"),
+            ("dist", "App version", "app_version_distribution"),
+            ("dist", "Printer model (top 20)", "printer_model_top20"),
+            ("dist", "Kinematics", "kinematics_distribution"),
+            ("dist", "Display", "display_resolution_distribution"),
+            ("dist", "Locale", "locale_distribution"),
+            ("dist", "Theme", "theme_distribution"),
+            ("dist", "Klipper version", "klipper_version_distribution"),
+            ("dist", "Host arch", "host_arch_distribution"),
+            ("dist", "RAM", "ram_distribution"),
+            ("pct", "Feature adoption (%)", "feature_adoption_rates"),
+        ),
+        show_note=True,
+    ),
+    ReportSection(
+        "print_reliability",
+        "PRINT RELIABILITY",
+        (
+            ("line", "  Total prints: {total_prints}"),
+            ("outcomes",),
+            ("dist", "Filament type", "filament_type_distribution"),
+            (
+                "items",
+                "Avg duration by outcome",
+                "avg_duration_by_outcome_sec",
+                "    {k}: {v}",
+                fmt_duration,
+            ),
+            (
+                "dist",
+                "Print start phases completed",
+                "phase_completion_distribution",
+            ),
+            ("dist", "Nozzle temp", "nozzle_temp_distribution"),
+            ("dist", "Bed temp", "bed_temp_distribution"),
+            (
+                "items",
+                "Success rate (weekly)",
+                "success_rate_weekly",
+                "    {k}: {v}%",
+            ),
+            (
+                "items",
+                "Success rate by printer model (min 5 prints)",
+                "success_rate_by_model",
+                "    {k}: {v[rate]}% ({v[total]} prints)",
+            ),
+            (
+                "items",
+                "Success rate by kinematics",
+                "success_rate_by_kinematics",
+                "    {k}: {v[rate]}% ({v[total]} prints)",
+            ),
+        ),
+        show_note=True,
+    ),
+    ReportSection(
+        "crash_analysis",
+        "CRASH ANALYSIS",
+        (
+            ("line", "  Total crashes: {total_crashes}"),
+            ("line", "  Total sessions: {total_sessions}"),
+            ("ratio", "  Crash rate: ", "crash_rate"),
+            (
+                "duration",
+                "  Mean uptime before crash: ",
+                "mean_uptime_before_crash_sec",
+                False,
+            ),
+            (
+                "duration",
+                "  Median uptime before crash: ",
+                "median_uptime_before_crash_sec",
+                False,
+            ),
+            ("dist", "Crashes by signal", "crashes_by_signal"),
+            ("dist", "Crashes by platform", "crashes_by_platform"),
+            ("dist", "Crashes by version", "crashes_by_version"),
+            (
+                "items",
+                "Crash rate per version",
+                "crash_rate_per_version",
+                "    {k}: {v}",
+                fmt_ratio,
+            ),
+            (
+                "dist",
+                "Uptime before crash",
+                "uptime_distribution_before_crash",
+            ),
+        ),
+        show_note=True,
+    ),
+    ReportSection(
+        "update_analysis",
+        "UPDATES: {total_attempts} attempts, {successes} succeeded, "
+        "{failures} failed ({success_rate:.0f}% success rate)",
+        (
+            ("dist", "Failure reasons", "failure_reasons"),
+            ("dist", "Failures by platform", "failures_by_platform"),
+        ),
+    ),
+    ReportSection(
+        "memory_analysis",
+        "MEMORY ANALYSIS",
+        (
+            ("line", "  Total snapshots: {total_snapshots}"),
+            (
+                "stats",
+                ("rss_kb", "vm_size_kb", "vm_peak_kb", "vm_hwm_kb"),
+                ("mean", "max", "p95"),
+                "  {col}: mean={mean:.0f} max={max:.0f} p95={p95:.0f}",
+            ),
+        ),
+    ),
+    ReportSection(
+        "hardware_analysis",
+        "HARDWARE ANALYSIS",
+        (
+            ("line", "  Total profiles: {total_profiles}"),
+            ("dist", "Printer model (top 20)", "printer_model_distribution"),
+            ("dist", "Kinematics", "kinematics_distribution"),
+            ("dist", "Primary MCU (top 10)", "primary_mcu_distribution"),
+            ("dist", "Extruder count", "extruder_count_distribution"),
+            ("dist", "AMS type", "ams_type_distribution"),
+            ("dist", "Display backend", "display_backend_distribution"),
+            (
+                "capabilities",
+                (
+                    "capabilities.has_chamber",
+                    "capabilities.has_accelerometer",
+                    "capabilities.has_firmware_retraction",
+                    "capabilities.has_exclude_object",
+                    "capabilities.has_timelapse",
+                    "capabilities.has_klippain_shaketune",
+                    "probe.has_probe",
+                    "probe.has_bed_mesh",
+                    "probe.has_qgl",
+                ),
+                "Capability adoption (%)",
+            ),
+        ),
+    ),
+    ReportSection(
+        "settings_analysis",
+        "SETTINGS ANALYSIS",
+        (
+            ("line", "  Total snapshots: {total_snapshots}"),
+            ("dist", "Theme", "theme_distribution"),
+            ("dist", "Locale", "locale_distribution"),
+            ("dist", "Time format", "time_format_distribution"),
+            ("value", "\n  Average brightness: {:.0f}%", "brightness_mean"),
+        ),
+    ),
+    ReportSection(
+        "panel_usage_analysis",
+        "PANEL USAGE",
+        (
+            ("line", "  Sessions with usage data: {total_sessions}"),
+            (
+                "duration",
+                "  Avg session duration: ",
+                "avg_session_duration_sec",
+                True,
+            ),
+            (
+                "dist",
+                "Total time by panel (sec)",
+                "total_time_by_panel_sec",
+            ),
+            ("dist", "Total visits by panel", "total_visits_by_panel"),
+        ),
+    ),
+    ReportSection(
+        "connection_analysis",
+        "CONNECTION STABILITY",
+        (
+            ("line", "  Sessions: {total_sessions}"),
+            ("value", "  Overall connected: {:.1f}%", "overall_connected_pct"),
+            (
+                "stats",
+                (
+                    "connect_count",
+                    "disconnect_count",
+                    "klippy_error_count",
+                    "klippy_shutdown_count",
+                ),
+                ("total", "mean"),
+                "  {col}: total={total} mean={mean:.2f}/session",
+            ),
+            (
+                "duration",
+                "  Longest disconnect: ",
+                "longest_disconnect_max_sec",
+                False,
+            ),
+        ),
+    ),
+    ReportSection(
+        "print_start_analysis",
+        "PRINT START CONTEXT",
+        (
+            ("line", "  Total print starts: {total_print_starts}"),
+            ("value", "  Has thumbnail: {:.1f}%", "thumbnail_pct"),
+            ("value", "  AMS active: {:.1f}%", "ams_active_pct"),
+            ("dist", "Source", "source_distribution"),
+            ("dist", "Slicer (top 10)", "slicer_distribution"),
+            ("dist", "File size", "file_size_distribution"),
+            (
+                "dist",
+                "Estimated duration",
+                "duration_estimate_distribution",
+            ),
+        ),
+    ),
+    ReportSection(
+        "error_analysis",
+        "ERROR ANALYSIS",
+        (
+            ("line", "  Total errors: {total_errors}"),
+            ("dist", "By category", "errors_by_category"),
+            ("dist", "By code (top 10)", "errors_by_code"),
+            ("dist", "By context (top 10)", "errors_by_context"),
+        ),
+    ),
+)
 
 
 class TelemetryAnalyzer:
     """Loads telemetry events and computes analytics."""
 
+    # Event frames. Each starts out as an empty DataFrame created on first
+    # access (see __getattr__), so an analyzer that never loads anything
+    # doesn't import pandas.
+    sessions: pd.DataFrame
+    prints: pd.DataFrame
+    crashes: pd.DataFrame
+    update_failures: pd.DataFrame
+    update_successes: pd.DataFrame
+    memory_snapshots: pd.DataFrame
+    hardware_profiles: pd.DataFrame
+    settings_snapshots: pd.DataFrame
+    panel_usage: pd.DataFrame
+    connection_stability: pd.DataFrame
+    print_starts: pd.DataFrame
+    errors: pd.DataFrame
+    all_events: pd.DataFrame
+
     def __init__(self):
-        self.sessions: pd.DataFrame = pd.DataFrame()
-        self.prints: pd.DataFrame = pd.DataFrame()
-        self.crashes: pd.DataFrame = pd.DataFrame()
-        self.update_failures: pd.DataFrame = pd.DataFrame()
-        self.update_successes: pd.DataFrame = pd.DataFrame()
-        self.memory_snapshots: pd.DataFrame = pd.DataFrame()
-        self.hardware_profiles: pd.DataFrame = pd.DataFrame()
-        self.settings_snapshots: pd.DataFrame = pd.DataFrame()
-        self.panel_usage: pd.DataFrame = pd.DataFrame()
-        self.connection_stability: pd.DataFrame = pd.DataFrame()
-        self.print_starts: pd.DataFrame = pd.DataFrame()
-        self.errors: pd.DataFrame = pd.DataFrame()
-        self.all_events: pd.DataFrame = pd.DataFrame()
+        # field -> (sessions frame it was built from, device_id lookup)
+        self._session_lut_cache: dict[str, tuple[pd.DataFrame, pd.Series]] = {}
+        # (id(frame), column) -> (frame, non-null value_counts)
+        self._col_cache: dict[
+            tuple[int, str], tuple[pd.DataFrame, pd.Series]
+        ] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes not set yet
+        if name in EVENT_COUNT_FRAMES or name == "all_events":
+            import_dataframe_libs()
+            frame = pd.DataFrame()
+            setattr(self, name, frame)
+            return frame
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
 
     def load_events(
         self,
         data_dir: str,
         since: Optional[str] = None,
         until: Optional[str] = None,
+        engine: str = "pandas",
     ) -> None:
-        """Load all JSON event files from data_dir (recursively) and split by type."""
+        """Load all JSON event files from data_dir (recursively) and split by type.
+
+        engine="arrow" flattens events with pyarrow when it is installed,
+        falling back to pd.json_normalize otherwise.
+        """
         data_path = Path(data_dir)
-        if not data_path.exists():
+        if not data_path.is_dir():
             print(f"Data directory not found: {data_path}", file=sys.stderr)
             return
+        import_dataframe_libs()
 
         all_events: list[dict] = []
         json_files = sorted(data_path.rglob("*.json"))
@@ -112,16 +935,19 @@ class TelemetryAnalyzer:
             print(f"No JSON files found in {data_path}", file=sys.stderr)
             return
 
-        for fpath in json_files:
-            try:
-                with open(fpath, "r") as f:
-                    data = json.load(f)
-                if isinstance(data, list):
-                    all_events.extend(data)
-                elif isinstance(data, dict):
-                    all_events.append(data)
-            except (json.JSONDecodeError, OSError) as e:
-                print(f"Warning: skipping {fpath}: {e}", file=sys.stderr)
+        # File reads release the GIL, so a thread pool overlaps disk I/O.
+        # map() preserves file order, keeping event order deterministic.
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            results = list(ex.map(read_event_file, json_files))
+
+        for fpath, (data, err) in zip(json_files, results):
+            if err is not None:
+                print(f"Warning: skipping {fpath}: {err}", file=sys.stderr)
+            elif isinstance(data, list):
+                all_events.extend(data)
+            elif isinstance(data, dict):
+                all_events.append(data)
 
         if not all_events:
             print("No events loaded.", file=sys.stderr)
@@ -132,165 +958,61 @@ class TelemetryAnalyzer:
             file=sys.stderr,
         )
 
-        # Flatten nested fields for session events
-        flat_events = []
-        for ev in all_events:
-            flat = {
-                "event": ev.get("event"),
-                "device_id": ev.get("device_id"),
-                "timestamp": ev.get("timestamp"),
-                "schema_version": ev.get("schema_version"),
-            }
-
-            if ev.get("event") == "session":
-                for prefix in ("app", "host", "printer"):
-                    sub = ev.get(prefix, {})
-                    if isinstance(sub, dict):
-                        for k, v in sub.items():
-                            flat[f"{prefix}.{k}"] = v
-                flat["features"] = ev.get("features", [])
-
-            elif ev.get("event") == "print_outcome":
-                for k in (
-                    "outcome",
-                    "duration_sec",
-                    "phases_completed",
-                    "filament_used_mm",
-                    "filament_type",
-                    "nozzle_temp",
-                    "bed_temp",
-                ):
-                    flat[k] = ev.get(k)
-
-            elif ev.get("event") == "crash":
-                for k in (
-                    "signal",
-                    "signal_name",
-                    "app_version",
-                    "uptime_sec",
-                    "backtrace",
-                ):
-                    flat[k] = ev.get(k)
-
-            elif ev.get("event") == "update_failed":
-                for k in (
-                    "reason",
-                    "version",
-                    "from_version",
-                    "platform",
-                    "http_code",
-                    "file_size",
-                    "exit_code",
-                ):
-                    flat[k] = ev.get(k)
-
-            elif ev.get("event") == "update_success":
-                for k in (
-                    "version",
-                    "from_version",
-                    "platform",
-                ):
-                    flat[k] = ev.get(k)
-
-            elif ev.get("event") == "memory_snapshot":
-                for k in (
-                    "trigger",
-                    "uptime_sec",
-                    "rss_kb",
-                    "vm_size_kb",
-                    "vm_data_kb",
-                    "vm_swap_kb",
-                    "vm_peak_kb",
-                    "vm_hwm_kb",
-                ):
-                    flat[k] = ev.get(k)
-
-            elif ev.get("event") == "hardware_profile":
-                # Flatten nested sections with dot notation
-                for section in (
-                    "printer",
-                    "mcus",
-                    "build_volume",
-                    "extruders",
-                    "fans",
-                    "steppers",
-                    "leds",
-                    "sensors",
-                    "probe",
-                    "capabilities",
-                    "ams",
-                    "tools",
-                    "macros",
-                    "plugins",
-                ):
-                    sub = ev.get(section, {})
-                    if isinstance(sub, dict):
-                        for k, v in sub.items():
-                            flat[f"{section}.{k}"] = v
-                flat["display_backend"] = ev.get("display_backend")
-
-            elif ev.get("event") == "settings_snapshot":
-                for k in (
-                    "theme",
-                    "brightness_pct",
-                    "screensaver_timeout_sec",
-                    "screen_blank_timeout_sec",
-                    "locale",
-                    "sound_enabled",
-                    "auto_update_channel",
-                    "animations_enabled",
-                    "time_format",
-                ):
-                    flat[k] = ev.get(k)
-
-            elif ev.get("event") == "panel_usage":
-                flat["session_duration_sec"] = ev.get(
-                    "session_duration_sec"
+        # Flatten nested sections (app, host, printer, panel_time_sec, ...)
+        # one level deep into "section.field" columns. Lists such as
+        # session "features" are kept as-is.
+        df = None
+        if engine == "arrow":
+            if PYARROW_AVAILABLE:
+                df = flatten_events_arrow(all_events)
+                if df is None:
+                    print(
+                        "Warning: arrow engine could not infer a schema, "
+                        "falling back to pandas",
+                        file=sys.stderr,
+                    )
+            else:
+                print(
+                    "Warning: pyarrow not installed, using pandas engine",
+                    file=sys.stderr,
                 )
-                flat["overlay_open_count"] = ev.get("overlay_open_count")
-                for section in ("panel_time_sec", "panel_visits"):
-                    sub = ev.get(section, {})
-                    if isinstance(sub, dict):
-                        for k, v in sub.items():
-                            flat[f"{section}.{k}"] = v
-
-            elif ev.get("event") == "connection_stability":
-                for k in (
-                    "session_duration_sec",
-                    "connect_count",
-                    "disconnect_count",
-                    "total_connected_sec",
-                    "total_disconnected_sec",
-                    "longest_disconnect_sec",
-                    "klippy_error_count",
-                    "klippy_shutdown_count",
-                ):
-                    flat[k] = ev.get(k)
-
-            elif ev.get("event") == "print_start_context":
-                for k in (
-                    "source",
-                    "has_thumbnail",
-                    "file_size_bucket",
-                    "estimated_duration_bucket",
-                    "slicer",
-                    "tool_count_used",
-                    "ams_active",
-                ):
-                    flat[k] = ev.get(k)
-
-            elif ev.get("event") == "error_encountered":
-                for k in ("category", "code", "context", "uptime_sec"):
-                    flat[k] = ev.get(k)
-
-            flat_events.append(flat)
-
-        df = pd.DataFrame(flat_events)
+        if df is None:
+            df = pd.json_normalize(all_events, sep=".", max_level=1)
+        # Drop payload fields no event type declares. This is one check per
+        # column, not a per-event dispatch, and keeps the frame narrow.
+        undeclared = [c for c in df.columns if not in_schema(c)]
+        if undeclared:
+            df = df.drop(columns=undeclared)
+        for col in BASE_FIELDS:
+            if col not in df.columns:
+                df[col] = None
+        df["event"] = df["event"].astype("category")
+        if PYARROW_AVAILABLE:
+            # device_id (hashed by every nunique()/groupby pass) and the
+            # free-form string fields that aren't stored as category
+            df = df.astype(
+                {
+                    c: "string[pyarrow]"
+                    for c in ARROW_STRING_COLUMNS
+                    if c in df.columns
+                }
+            )
+        for col, dtype in NUMERIC_COLUMNS.items():
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors="coerce").astype(dtype)
+        for col in BOOLEAN_COLUMNS:
+            if col in df.columns:
+                try:
+                    df[col] = df[col].astype("boolean")
+                except (TypeError, ValueError):
+                    pass  # non-bool payloads; _bool_pct() compares == True
 
         # Parse timestamps
         if "timestamp" in df.columns:
+            # Event timestamps are ISO 8601; a fixed format skips per-row
+            # format inference. Anything else becomes NaT.
             df["timestamp"] = pd.to_datetime(
-                df["timestamp"], errors="coerce", utc=True
+                df["timestamp"], format="ISO8601", errors="coerce", utc=True
             )
 
             if since:
@@ -302,30 +1024,95 @@ class TelemetryAnalyzer:
                 )
                 df = df[df["timestamp"] < until_dt]
 
+            # Calendar keys shared by every per-type frame, computed once
+            # here instead of re-deriving Periods in each metric pass.
+            df = df.assign(
+                _date=df["timestamp"].dt.strftime("%Y-%m-%d"),
+                _week=(
+                    (df["timestamp"] - pd.Timestamp(EPOCH_MONDAY))
+                    // pd.Timedelta(weeks=1)
+                ).astype("Int32"),
+                _month=df["timestamp"].dt.strftime("%Y-%m"),
+            )
+
+        # One hash-partition pass over the event column instead of a full
+        # boolean-mask scan per event type. Each group keeps only its own
+        # schema's columns, so the per-type frames don't carry the mostly
+        # NaN columns of every other event type.
         self.all_events = df
-        self.sessions = df[df["event"] == "session"].copy()
-        self.prints = df[df["event"] == "print_outcome"].copy()
-        self.crashes = df[df["event"] == "crash"].copy()
-        self.update_failures = df[df["event"] == "update_failed"].copy()
-        self.update_successes = df[df["event"] == "update_success"].copy()
-        self.memory_snapshots = df[df["event"] == "memory_snapshot"].copy()
-        self.hardware_profiles = df[
-            df["event"] == "hardware_profile"
-        ].copy()
-        self.settings_snapshots = df[
-            df["event"] == "settings_snapshot"
-        ].copy()
-        self.panel_usage = df[df["event"] == "panel_usage"].copy()
-        self.connection_stability = df[
-            df["event"] == "connection_stability"
-        ].copy()
-        self.print_starts = df[
-            df["event"] == "print_start_context"
-        ].copy()
-        self.errors = df[df["event"] == "error_encountered"].copy()
+        self._session_lut_cache.clear()
+        self._col_cache.clear()
+        parts = dict(tuple(df.groupby("event", sort=False, observed=True)))
+
+        def frame(event: str) -> pd.DataFrame:
+            part = parts.get(event, df.iloc[:0])
+            part = part.reindex(columns=event_columns(part.columns, event))
+            return part.astype(
+                {
+                    c: appearance_categories(part[c])
+                    for c in CATEGORY_COLUMNS.get(event, ())
+                    if c in part.columns
+                }
+            )
+
+        self.sessions = self._fill_missing_features(
+            frame("session"), all_events
+        )
+        self.prints = frame("print_outcome")
+        self.crashes = frame("crash")
+        self.update_failures = frame("update_failed")
+        self.update_successes = frame("update_success")
+        self.memory_snapshots = frame("memory_snapshot")
+        self.hardware_profiles = frame("hardware_profile")
+        self.settings_snapshots = frame("settings_snapshot")
+        self.panel_usage = frame("panel_usage")
+        self.connection_stability = frame("connection_stability")
+        self.print_starts = frame("print_start_context")
+        self.errors = frame("error_encountered")
+        # Success flag derived once; rate metrics sum this bool column
+        # instead of re-comparing outcome strings
+        if "outcome" in self.prints.columns:
+            self.prints = self.prints.assign(
+                _is_success=self._success_mask(self.prints)
+            )
+
+    @staticmethod
+    def _fill_missing_features(
+        sessions: pd.DataFrame, raw_events: list[dict]
+    ) -> pd.DataFrame:
+        """Give sessions that omit the "features" key an empty list.
+
+        Normalization leaves such rows NaN, which would drop them from the
+        feature adoption denominator. An explicit null is left as-is. The
+        frame index is positional into raw_events.
+        """
+        if "features" in sessions.columns:
+            feats = sessions["features"]
+        else:
+            feats = pd.Series(None, index=sessions.index, dtype=object)
+        absent = [
+            i
+            for i in feats.index[feats.isna()]
+            if "features" not in raw_events[i]
+        ]
+        if not absent:
+            return sessions
+        feats = feats.astype(object)
+        feats.loc[absent] = pd.Series(
+            [[] for _ in absent], index=absent, dtype=object
+        )
+        return sessions.assign(features=feats)
+
+    def _count_frames(self) -> dict[str, int]:
+        counts = {
+            name: len(getattr(self, name)) for name in EVENT_COUNT_FRAMES
+        }
+        counts["total"] = len(self.all_events)
+        return counts
 
     # -- Adoption Metrics --------------------------------------------------
 
+    @rounded_metrics
     def compute_adoption_metrics(self) -> dict:
         result: dict[str, Any] = {}
         s = self.sessions
@@ -338,31 +1125,15 @@ class TelemetryAnalyzer:
         # Active devices by period
         if "timestamp" in s.columns and s["timestamp"].notna().any():
             ts = s.dropna(subset=["timestamp"])
-            result["active_devices_daily"] = {
-                str(k): v
-                for k, v in ts.groupby(ts["timestamp"].dt.date)["device_id"]
-                .nunique()
-                .to_dict()
-                .items()
-            }
-            result["active_devices_weekly"] = {
-                str(k): v
-                for k, v in ts.groupby(ts["timestamp"].dt.to_period("W"))[
-                    "device_id"
-                ]
-                .nunique()
-                .to_dict()
-                .items()
-            }
-            result["active_devices_monthly"] = {
-                str(k): v
-                for k, v in ts.groupby(ts["timestamp"].dt.to_period("M"))[
-                    "device_id"
-                ]
-                .nunique()
-                .to_dict()
-                .items()
-            }
+            result["active_devices_daily"] = (
+                ts.groupby("_date")["device_id"].nunique().to_dict()
+            )
+            result["active_devices_weekly"] = iso_week_labels(
+                ts.groupby("_week")["device_id"].nunique()
+            )
+            result["active_devices_monthly"] = (
+                ts.groupby("_month")["device_id"].nunique().to_dict()
+            )
 
             # New devices per period (first seen date)
             first_seen = ts.groupby("device_id")["timestamp"].min().dt.date
@@ -394,27 +1165,23 @@ class TelemetryAnalyzer:
 
         # RAM distribution (bucketed)
         if "host.ram_total_mb" in s.columns:
-            ram_vals = pd.to_numeric(s["host.ram_total_mb"], errors="coerce")
-            ram_bucketed = ram_vals.apply(
-                lambda v: bucket_value(v, RAM_BUCKETS)
+            result["ram_distribution"] = bucket_counts(
+                s["host.ram_total_mb"], RAM_EDGES, RAM_LABELS
             )
-            result["ram_distribution"] = ram_bucketed.value_counts().to_dict()
 
         # Feature adoption rates
         if "features" in s.columns:
-            feature_counts: dict[str, int] = {}
-            total_with_features = 0
-            for feat_list in s["features"]:
-                if isinstance(feat_list, list):
-                    total_with_features += 1
-                    for f in feat_list:
-                        feature_counts[f] = feature_counts.get(f, 0) + 1
+            has_list = s["features"].map(lambda x: isinstance(x, list))
+            total_with_features = int(has_list.sum())
             if total_with_features > 0:
+                # explode() turns empty lists into NaN, which value_counts()
+                # drops; the result is already sorted by count descending.
+                feature_counts = (
+                    s.loc[has_list, "features"].explode().value_counts()
+                )
                 result["feature_adoption_rates"] = {
                     k: round(v / total_with_features * 100, 1)
-                    for k, v in sorted(
-                        feature_counts.items(), key=lambda x: -x[1]
-                    )
+                    for k, v in feature_counts.items()
                 }
             else:
                 result["feature_adoption_rates"] = {}
@@ -423,6 +1190,7 @@ class TelemetryAnalyzer:
 
     # -- Print Reliability -------------------------------------------------
 
+    @rounded_metrics
     def compute_print_metrics(self) -> dict:
         result: dict[str, Any] = {}
         p = self.prints
@@ -445,15 +1213,14 @@ class TelemetryAnalyzer:
             # Success rate over time (weekly)
             if "timestamp" in p.columns and p["timestamp"].notna().any():
                 ts = p.dropna(subset=["timestamp"])
-                weekly = ts.groupby(ts["timestamp"].dt.to_period("W"))
-                success_weekly = {}
-                for period, group in weekly:
-                    n = len(group)
-                    successes = (group["outcome"] == "success").sum()
-                    success_weekly[str(period)] = round(
-                        successes / n * 100, 1
-                    )
-                result["success_rate_weekly"] = success_weekly
+                weekly = (
+                    self._success_mask(ts)
+                    .groupby(ts["_week"])
+                    .agg(n="size", s="sum")
+                )
+                result["success_rate_weekly"] = iso_week_labels(
+                    (weekly["s"] / weekly["n"] * 100).round(1)
+                )
 
             # Success rate by printer model (min 5 prints)
             # Join with session data to get printer model
@@ -474,9 +1241,7 @@ class TelemetryAnalyzer:
 
         # Phase completion distribution
         if "phases_completed" in p.columns:
-            phases = pd.to_numeric(
-                p["phases_completed"], errors="coerce"
-            ).dropna()
+            phases = p["phases_completed"].dropna()
             if not phases.empty:
                 result["phase_completion_distribution"] = {
                     str(k): v
@@ -489,12 +1254,9 @@ class TelemetryAnalyzer:
 
         # Average duration by outcome
         if "duration_sec" in p.columns and "outcome" in p.columns:
-            durations = p.copy()
-            durations["duration_sec"] = pd.to_numeric(
-                durations["duration_sec"], errors="coerce"
-            )
             avg_dur = (
-                durations.groupby("outcome")["duration_sec"]
+                pd.to_numeric(p["duration_sec"], errors="coerce")
+                .groupby(p["outcome"])
                 .mean()
                 .round(1)
                 .to_dict()
@@ -506,37 +1268,33 @@ class TelemetryAnalyzer:
             ft = p["filament_type"].dropna()
             ft = ft[ft != ""]  # Filter empty strings
             if not ft.empty:
-                result["filament_type_distribution"] = (
-                    ft.value_counts().to_dict()
-                )
+                counts = ft.value_counts()
+                result["filament_type_distribution"] = counts[
+                    counts > 0
+                ].to_dict()
 
         # Temperature distributions (bucketed)
         if "nozzle_temp" in p.columns:
-            nt = pd.to_numeric(p["nozzle_temp"], errors="coerce")
+            nt = p["nozzle_temp"]
             nt = nt[nt > 0]  # Filter zero/unset temps
             if not nt.empty:
-                bucketed = nt.apply(
-                    lambda v: bucket_value(v, NOZZLE_TEMP_BUCKETS)
-                )
-                result["nozzle_temp_distribution"] = (
-                    bucketed.value_counts().to_dict()
+                result["nozzle_temp_distribution"] = bucket_counts(
+                    nt, NOZZLE_TEMP_EDGES, NOZZLE_TEMP_LABELS
                 )
 
         if "bed_temp" in p.columns:
-            bt = pd.to_numeric(p["bed_temp"], errors="coerce")
+            bt = p["bed_temp"]
             bt = bt[bt > 0]
             if not bt.empty:
-                bucketed = bt.apply(
-                    lambda v: bucket_value(v, BED_TEMP_BUCKETS)
-                )
-                result["bed_temp_distribution"] = (
-                    bucketed.value_counts().to_dict()
+                result["bed_temp_distribution"] = bucket_counts(
+                    bt, BED_TEMP_EDGES, BED_TEMP_LABELS
                 )
 
         return result
 
     # -- Crash Analysis ----------------------------------------------------
 
+    @rounded_metrics
     def compute_crash_metrics(self) -> dict:
         result: dict[str, Any] = {}
         c = self.crashes
@@ -566,15 +1324,12 @@ class TelemetryAnalyzer:
             not self.sessions.empty
             and "app.platform" in self.sessions.columns
         ):
-            device_platform = self.sessions.groupby("device_id")[
-                "app.platform"
-            ].first()
-            c_with_platform = c.copy()
-            c_with_platform["platform"] = c_with_platform["device_id"].map(
-                device_platform
-            )
+            # Memoized device -> first non-null platform, hash-reindexed
+            # onto the crash rows
+            device_platform = self._session_lookup("app.platform")
             result["crashes_by_platform"] = (
-                c_with_platform["platform"]
+                device_platform.reindex(c["device_id"])
+                .astype(object)
                 .fillna("unknown")
                 .value_counts()
                 .to_dict()
@@ -582,52 +1337,42 @@ class TelemetryAnalyzer:
 
         # Crashes by app version
         if "app_version" in c.columns:
-            result["crashes_by_version"] = (
-                c["app_version"].value_counts().to_dict()
-            )
+            crashes_by_ver = c["app_version"].value_counts()
+            result["crashes_by_version"] = crashes_by_ver.to_dict()
 
-            # Crash rate per version
+            # Crash rate per version: align session counts to the crash
+            # versions and divide as vectors; no sessions -> None
             if (
                 not self.sessions.empty
                 and "app.version" in self.sessions.columns
             ):
                 sessions_by_ver = (
-                    self.sessions["app.version"].value_counts().to_dict()
+                    self.sessions["app.version"]
+                    .value_counts()
+                    .reindex(crashes_by_ver.index, fill_value=0)
+                )
+                rates = (
+                    crashes_by_ver / sessions_by_ver.where(sessions_by_ver > 0)
+                ).round(4)
+                result["crash_rate_per_version"] = (
+                    rates.astype(object).where(rates.notna(), None).to_dict()
                 )
-                crash_rate_by_ver = {}
-                for ver, crash_count in (
-                    c["app_version"].value_counts().items()
-                ):
-                    sess_count = sessions_by_ver.get(ver, 0)
-                    if sess_count > 0:
-                        crash_rate_by_ver[ver] = round(
-                            crash_count / sess_count, 4
-                        )
-                    else:
-                        crash_rate_by_ver[ver] = None
-                result["crash_rate_per_version"] = crash_rate_by_ver
 
         # Uptime before crash
         if "uptime_sec" in c.columns:
-            uptime = pd.to_numeric(c["uptime_sec"], errors="coerce").dropna()
+            uptime = c["uptime_sec"].dropna()
             if not uptime.empty:
-                result["mean_uptime_before_crash_sec"] = round(
-                    uptime.mean(), 1
-                )
-                result["median_uptime_before_crash_sec"] = round(
-                    uptime.median(), 1
-                )
-                bucketed = uptime.apply(
-                    lambda v: bucket_value(v, UPTIME_BUCKETS)
-                )
-                result["uptime_distribution_before_crash"] = (
-                    bucketed.value_counts().to_dict()
+                result["mean_uptime_before_crash_sec"] = uptime.mean()
+                result["median_uptime_before_crash_sec"] = uptime.median()
+                result["uptime_distribution_before_crash"] = bucket_counts(
+                    uptime, UPTIME_EDGES, UPTIME_LABELS
                 )
 
         return result
 
     # -- Update Analysis ---------------------------------------------------
 
+    @rounded_metrics
     def compute_update_metrics(self) -> dict:
         result: dict[str, Any] = {}
         n_fail = len(self.update_failures)
@@ -663,23 +1408,27 @@ class TelemetryAnalyzer:
 
     # -- Memory Analysis ---------------------------------------------------
 
+    @rounded_metrics
     def compute_memory_metrics(self) -> dict:
         result: dict[str, Any] = {}
         m = self.memory_snapshots
         if m.empty:
             return {"note": "No memory snapshot data"}
         result["total_snapshots"] = len(m)
-        for col in ("rss_kb", "vm_size_kb", "vm_peak_kb", "vm_hwm_kb"):
-            if col in m.columns:
-                vals = pd.to_numeric(m[col], errors="coerce").dropna()
-                if not vals.empty:
-                    result[f"{col}_mean"] = round(vals.mean(), 1)
-                    result[f"{col}_max"] = round(vals.max(), 1)
-                    result[f"{col}_p95"] = round(vals.quantile(0.95), 1)
+        cols = [
+            c
+            for c in ("rss_kb", "vm_size_kb", "vm_peak_kb", "vm_hwm_kb")
+            if c in m.columns
+        ]
+        for col, (mean, peak, p95) in mean_max_p95(m[cols]).items():
+            result[f"{col}_mean"] = mean
+            result[f"{col}_max"] = peak
+            result[f"{col}_p95"] = p95
         return result
 
     # -- Hardware Analysis -------------------------------------------------
 
+    @rounded_metrics
     def compute_hardware_metrics(self) -> dict:
         result: dict[str, Any] = {}
         h = self.hardware_profiles
@@ -711,17 +1460,7 @@ class TelemetryAnalyzer:
             "probe.has_qgl",
         ):
             if cap in h.columns:
-                vals = h[cap].dropna()
-                true_count = (
-                    vals.sum()
-                    if vals.dtype == bool
-                    else (vals == True).sum()  # noqa: E712
-                )
-                result[f"{cap}_pct"] = (
-                    round(true_count / len(vals) * 100, 1)
-                    if len(vals) > 0
-                    else 0
-                )
+                result[f"{cap}_pct"] = self._bool_pct(h, cap)
         result["ams_type_distribution"] = self._distribution(
             h, "ams.type"
         )
@@ -732,6 +1471,7 @@ class TelemetryAnalyzer:
 
     # -- Settings Analysis -------------------------------------------------
 
+    @rounded_metrics
     def compute_settings_metrics(self) -> dict:
         result: dict[str, Any] = {}
         s = self.settings_snapshots
@@ -741,11 +1481,9 @@ class TelemetryAnalyzer:
         result["theme_distribution"] = self._distribution(s, "theme")
         result["locale_distribution"] = self._distribution(s, "locale")
         if "brightness_pct" in s.columns:
-            vals = pd.to_numeric(
-                s["brightness_pct"], errors="coerce"
-            ).dropna()
+            vals = s["brightness_pct"].dropna()
             if not vals.empty:
-                result["brightness_mean"] = round(vals.mean(), 1)
+                result["brightness_mean"] = vals.mean()
         result["time_format_distribution"] = self._distribution(
             s, "time_format"
         )
@@ -753,50 +1491,30 @@ class TelemetryAnalyzer:
 
     # -- Panel Usage -------------------------------------------------------
 
+    @rounded_metrics
     def compute_panel_usage_metrics(self) -> dict:
         result: dict[str, Any] = {}
         p = self.panel_usage
         if p.empty:
             return {"note": "No panel usage data"}
         result["total_sessions"] = len(p)
-        # Aggregate panel time across sessions
-        time_cols = [
-            c for c in p.columns if c.startswith("panel_time_sec.")
-        ]
-        if time_cols:
-            panel_totals = {}
-            for col in time_cols:
-                panel_name = col.replace("panel_time_sec.", "")
-                vals = pd.to_numeric(p[col], errors="coerce").fillna(0)
-                panel_totals[panel_name] = int(vals.sum())
-            result["total_time_by_panel_sec"] = dict(
-                sorted(panel_totals.items(), key=lambda x: -x[1])
-            )
-        visit_cols = [
-            c for c in p.columns if c.startswith("panel_visits.")
-        ]
-        if visit_cols:
-            panel_visits = {}
-            for col in visit_cols:
-                panel_name = col.replace("panel_visits.", "")
-                vals = pd.to_numeric(p[col], errors="coerce").fillna(0)
-                panel_visits[panel_name] = int(vals.sum())
-            result["total_visits_by_panel"] = dict(
-                sorted(panel_visits.items(), key=lambda x: -x[1])
-            )
+        # Aggregate panel time and visits across sessions
+        totals = self._prefixed_column_totals(p, "panel_time_sec.")
+        if totals:
+            result["total_time_by_panel_sec"] = totals
+        visits = self._prefixed_column_totals(p, "panel_visits.")
+        if visits:
+            result["total_visits_by_panel"] = visits
         if "session_duration_sec" in p.columns:
-            dur = pd.to_numeric(
-                p["session_duration_sec"], errors="coerce"
-            ).dropna()
+            dur = p["session_duration_sec"].dropna()
             if not dur.empty:
-                result["avg_session_duration_sec"] = round(dur.mean(), 1)
-                result["median_session_duration_sec"] = round(
-                    dur.median(), 1
-                )
+                result["avg_session_duration_sec"] = dur.mean()
+                result["median_session_duration_sec"] = dur.median()
         return result
 
     # -- Connection Stability ----------------------------------------------
 
+    @rounded_metrics
     def compute_connection_metrics(self) -> dict:
         result: dict[str, Any] = {}
         c = self.connection_stability
@@ -810,40 +1528,31 @@ class TelemetryAnalyzer:
             "klippy_shutdown_count",
         ):
             if col in c.columns:
-                vals = pd.to_numeric(c[col], errors="coerce").dropna()
+                vals = c[col].dropna()
                 if not vals.empty:
                     result[f"{col}_total"] = int(vals.sum())
-                    result[f"{col}_mean"] = round(vals.mean(), 2)
+                    result[f"{col}_mean"] = vals.mean()
         if (
             "total_connected_sec" in c.columns
             and "session_duration_sec" in c.columns
         ):
-            connected = pd.to_numeric(
-                c["total_connected_sec"], errors="coerce"
-            ).fillna(0)
-            duration = pd.to_numeric(
-                c["session_duration_sec"], errors="coerce"
-            ).fillna(0)
+            connected = c["total_connected_sec"].fillna(0)
+            duration = c["session_duration_sec"].fillna(0)
             total_dur = duration.sum()
             if total_dur > 0:
-                result["overall_connected_pct"] = round(
-                    connected.sum() / total_dur * 100, 1
+                result["overall_connected_pct"] = (
+                    connected.sum() / total_dur * 100
                 )
         if "longest_disconnect_sec" in c.columns:
-            vals = pd.to_numeric(
-                c["longest_disconnect_sec"], errors="coerce"
-            ).dropna()
+            vals = c["longest_disconnect_sec"].dropna()
             if not vals.empty:
-                result["longest_disconnect_max_sec"] = round(
-                    vals.max(), 1
-                )
-                result["longest_disconnect_mean_sec"] = round(
-                    vals.mean(), 1
-                )
+                result["longest_disconnect_max_sec"] = vals.max()
+                result["longest_disconnect_mean_sec"] = vals.mean()
         return result
 
     # -- Print Start Context -----------------------------------------------
 
+    @rounded_metrics
     def compute_print_start_metrics(self) -> dict:
         result: dict[str, Any] = {}
         p = self.print_starts
@@ -861,33 +1570,14 @@ class TelemetryAnalyzer:
             p, "estimated_duration_bucket"
         )
         if "has_thumbnail" in p.columns:
-            vals = p["has_thumbnail"].dropna()
-            true_count = (
-                vals.sum()
-                if vals.dtype == bool
-                else (vals == True).sum()  # noqa: E712
-            )
-            result["thumbnail_pct"] = (
-                round(true_count / len(vals) * 100, 1)
-                if len(vals) > 0
-                else 0
-            )
+            result["thumbnail_pct"] = self._bool_pct(p, "has_thumbnail")
         if "ams_active" in p.columns:
-            vals = p["ams_active"].dropna()
-            true_count = (
-                vals.sum()
-                if vals.dtype == bool
-                else (vals == True).sum()  # noqa: E712
-            )
-            result["ams_active_pct"] = (
-                round(true_count / len(vals) * 100, 1)
-                if len(vals) > 0
-                else 0
-            )
+            result["ams_active_pct"] = self._bool_pct(p, "ams_active")
         return result
 
     # -- Error Analysis ----------------------------------------------------
 
+    @rounded_metrics
     def compute_error_metrics(self) -> dict:
         result: dict[str, Any] = {}
         e = self.errors
@@ -904,34 +1594,16 @@ class TelemetryAnalyzer:
     # -- Aggregate ---------------------------------------------------------
 
     def compute_all(self) -> dict:
+        # Sequential: several families read self.sessions and share the
+        # unsynchronized lookup caches
+        families = {
+            key: getattr(self, method)()
+            for key, method in METRIC_FAMILIES.items()
+        }
         return {
             "generated_at": datetime.now(tz=timezone.utc).isoformat(),
-            "event_counts": {
-                "sessions": len(self.sessions),
-                "prints": len(self.prints),
-                "crashes": len(self.crashes),
-                "update_failures": len(self.update_failures),
-                "update_successes": len(self.update_successes),
-                "memory_snapshots": len(self.memory_snapshots),
-                "hardware_profiles": len(self.hardware_profiles),
-                "settings_snapshots": len(self.settings_snapshots),
-                "panel_usage": len(self.panel_usage),
-                "connection_stability": len(self.connection_stability),
-                "print_starts": len(self.print_starts),
-                "errors": len(self.errors),
-                "total": len(self.all_events),
-            },
-            "adoption": self.compute_adoption_metrics(),
-            "print_reliability": self.compute_print_metrics(),
-            "crash_analysis": self.compute_crash_metrics(),
-            "update_analysis": self.compute_update_metrics(),
-            "memory_analysis": self.compute_memory_metrics(),
-            "hardware_analysis": self.compute_hardware_metrics(),
-            "settings_analysis": self.compute_settings_metrics(),
-            "panel_usage_analysis": self.compute_panel_usage_metrics(),
-            "connection_analysis": self.compute_connection_metrics(),
-            "print_start_analysis": self.compute_print_start_metrics(),
-            "error_analysis": self.compute_error_metrics(),
+            "event_counts": self._count_frames(),
+            **families,
         }
 
     # -- Output Formatters -------------------------------------------------
@@ -961,477 +1633,294 @@ class TelemetryAnalyzer:
             f"errors={ec.get('errors', 0)})"
         )
 
-        # Adoption
+        for section in REPORT_SECTIONS:
+            self._render_section(lines, section, metrics.get(section.key, {}))
+
         lines.append(f"\n{sep}")
-        lines.append("  ADOPTION METRICS")
-        lines.append(sep)
-        adoption = metrics.get("adoption", {})
-        if adoption.get("note"):
-            lines.append(f"  {adoption['note']}")
-        else:
-            lines.append(
-                f"  Total unique devices: "
-                f"{adoption.get('total_unique_devices', 0)}"
-            )
-            self._fmt_distribution(
-                lines, "Platform", adoption.get("platform_distribution")
-            )
-            self._fmt_distribution(
-                lines, "App version", adoption.get("app_version_distribution")
-            )
-            self._fmt_distribution(
-                lines,
-                "Printer model (top 20)",
-                adoption.get("printer_model_top20"),
-            )
-            self._fmt_distribution(
-                lines, "Kinematics", adoption.get("kinematics_distribution")
-            )
-            self._fmt_distribution(
-                lines,
-                "Display",
-                adoption.get("display_resolution_distribution"),
-            )
-            self._fmt_distribution(
-                lines, "Locale", adoption.get("locale_distribution")
-            )
-            self._fmt_distribution(
-                lines, "Theme", adoption.get("theme_distribution")
-            )
-            self._fmt_distribution(
-                lines,
-                "Klipper version",
-                adoption.get("klipper_version_distribution"),
-            )
-            self._fmt_distribution(
-                lines, "Host arch", adoption.get("host_arch_distribution")
-            )
-            self._fmt_distribution(
-                lines, "RAM", adoption.get("ram_distribution")
-            )
-            self._fmt_percentages(
-                lines,
-                "Feature adoption (%)",
-                adoption.get("feature_adoption_rates"),
-            )
+        return "\n".join(lines)
 
-        # Print reliability
+    def _render_section(
+        self, lines: list[str], section: "ReportSection", data: dict
+    ) -> None:
+        """Append one report section, driven by its row table."""
+        if data.get("note") and not section.show_note:
+            return
+        sep = "=" * 60
         lines.append(f"\n{sep}")
-        lines.append("  PRINT RELIABILITY")
+        lines.append("  " + section.title.format_map(_ZeroDefault(data)))
         lines.append(sep)
-        pr = metrics.get("print_reliability", {})
-        if pr.get("note"):
-            lines.append(f"  {pr['note']}")
-        else:
-            lines.append(f"  Total prints: {pr.get('total_prints', 0)}")
-            rates = pr.get("outcome_rates", {})
-            for outcome, rate in rates.items():
-                count = pr.get("outcome_counts", {}).get(outcome, 0)
-                lines.append(f"    {outcome}: {rate}% ({count})")
-
-            self._fmt_distribution(
-                lines, "Filament type", pr.get("filament_type_distribution")
-            )
-
-            avg_dur = pr.get("avg_duration_by_outcome_sec", {})
-            if avg_dur:
-                lines.append("\n  Avg duration by outcome:")
-                for outcome, dur in avg_dur.items():
-                    lines.append(
-                        f"    {outcome}: {self._fmt_duration(dur)}"
-                    )
-
-            self._fmt_distribution(
-                lines,
-                "Print start phases completed",
-                pr.get("phase_completion_distribution"),
-            )
-            self._fmt_distribution(
-                lines, "Nozzle temp", pr.get("nozzle_temp_distribution")
-            )
-            self._fmt_distribution(
-                lines, "Bed temp", pr.get("bed_temp_distribution")
-            )
-
-            sr_weekly = pr.get("success_rate_weekly", {})
-            if sr_weekly:
-                lines.append("\n  Success rate (weekly):")
-                for period, rate in sr_weekly.items():
-                    lines.append(f"    {period}: {rate}%")
-
-            sr_model = pr.get("success_rate_by_model", {})
-            if sr_model:
-                lines.append(
-                    "\n  Success rate by printer model (min 5 prints):"
-                )
-                for model, info in sr_model.items():
-                    lines.append(
-                        f"    {model}: {info['rate']}% "
-                        f"({info['total']} prints)"
-                    )
+        if data.get("note"):
+            lines.append(f"  {data['note']}")
+            return
+        for kind, *args in section.rows:
+            if kind == "line":
+                lines.append(args[0].format_map(_ZeroDefault(data)))
+            elif kind == "dist":
+                self._fmt_distribution(lines, args[0], data.get(args[1]))
+            elif kind == "pct":
+                self._fmt_percentages(lines, args[0], data.get(args[1]))
+            elif kind == "value":
+                value = data.get(args[1])
+                if value is not None:
+                    lines.append(args[0].format(value))
+            elif kind == "ratio":
+                lines.append(args[0] + fmt_ratio(data.get(args[1])))
+            elif kind == "duration":
+                label, key, skip_falsy = args
+                value = data.get(key)
+                keep = bool(value) if skip_falsy else value is not None
+                if keep:
+                    lines.append(f"{label}{fmt_duration(value)}")
+            elif kind == "items":
+                title, key, fmt, *convert = args
+                items = data.get(key, {})
+                if items:
+                    conv = convert[0] if convert else None
+                    lines.append(f"\n  {title}:")
+                    for k, v in items.items():
+                        lines.append(fmt.format(k=k, v=conv(v) if conv else v))
+            elif kind == "stats":
+                cols, suffixes, fmt = args
+                for col in cols:
+                    values = {
+                        sfx: data.get(f"{col}_{sfx}") for sfx in suffixes
+                    }
+                    if values[suffixes[0]] is not None:
+                        lines.append(fmt.format(col=col, **values))
+            elif kind == "capabilities":
+                cap_lines = [
+                    f"    {cap.split('.')[-1]}: {data[f'{cap}_pct']}%"
+                    for cap in args[0]
+                    if data.get(f"{cap}_pct") is not None
+                ]
+                if cap_lines:
+                    lines.append(f"\n  {args[1]}:")
+                    lines.extend(cap_lines)
+            elif kind == "outcomes":
+                counts = data.get("outcome_counts", {})
+                for outcome, rate in data.get("outcome_rates", {}).items():
+                    count = counts.get(outcome, 0)
+                    lines.append(f"    {outcome}: {rate}% ({count})")
 
-            sr_kin = pr.get("success_rate_by_kinematics", {})
-            if sr_kin:
-                lines.append("\n  Success rate by kinematics:")
-                for kin, info in sr_kin.items():
-                    lines.append(
-                        f"    {kin}: {info['rate']}% ({info['total']} prints)"
-                    )
+    def format_json(self, metrics: dict) -> str:
+        data = json_ready(metrics)
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(data, indent=2, ensure_ascii=False)
 
-        # Crash analysis
-        lines.append(f"\n{sep}")
-        lines.append("  CRASH ANALYSIS")
-        lines.append(sep)
-        ca = metrics.get("crash_analysis", {})
-        if ca.get("note"):
-            lines.append(f"  {ca['note']}")
-        else:
-            lines.append(
-                f"  Total crashes: {ca.get('total_crashes', 0)}"
-            )
-            lines.append(
-                f"  Total sessions: {ca.get('total_sessions', 0)}"
-            )
-            cr = ca.get("crash_rate")
-            lines.append(
-                f"  Crash rate: {f'{cr:.2%}' if cr is not None else 'N/A'}"
-            )
+    def format_html(
+        self,
+        metrics: dict,
+        output_path: str,
+        terminal_str: Optional[str] = None,
+        json_str: Optional[str] = None,
+    ) -> None:
+        """Write the HTML report.
+
+        Callers that already rendered the terminal or JSON report can pass
+        it in so it isn't rendered a second time.
+        """
+        if json_str is None:
+            json_str = self.format_json(metrics)
+        if terminal_str is None:
+            terminal_str = self.format_terminal(metrics)
+        html = HTML_TEMPLATE.substitute(
+            generated_at=metrics.get("generated_at", ""),
+            terminal=terminal_str,
+            json=json_str,
+        )
+        with open(
+            output_path, "w", encoding="utf-8", buffering=1 << 16
+        ) as f:
+            f.write(html)
+        print(f"HTML report written to {output_path}", file=sys.stderr)
 
-            mean_up = ca.get("mean_uptime_before_crash_sec")
-            if mean_up is not None:
-                lines.append(
-                    f"  Mean uptime before crash: "
-                    f"{self._fmt_duration(mean_up)}"
-                )
-            med_up = ca.get("median_uptime_before_crash_sec")
-            if med_up is not None:
-                lines.append(
-                    f"  Median uptime before crash: "
-                    f"{self._fmt_duration(med_up)}"
-                )
+    # -- Helpers -----------------------------------------------------------
 
-            self._fmt_distribution(
-                lines, "Crashes by signal", ca.get("crashes_by_signal")
-            )
-            self._fmt_distribution(
-                lines,
-                "Crashes by platform",
-                ca.get("crashes_by_platform"),
-            )
-            self._fmt_distribution(
-                lines,
-                "Crashes by version",
-                ca.get("crashes_by_version"),
-            )
+    def _join_session_field(
+        self, df: pd.DataFrame, field: str
+    ) -> pd.DataFrame:
+        """Join a session field onto another dataframe by device_id."""
+        if field not in self.sessions.columns:
+            return df
+        # assign() adds (or replaces) the one column without copying the
+        # rest of df's blocks; rows, order and index are unchanged
+        return df.assign(
+            **{field: df["device_id"].map(self._session_lookup(field))}
+        )
 
-            cr_ver = ca.get("crash_rate_per_version", {})
-            if cr_ver:
-                lines.append("\n  Crash rate per version:")
-                for ver, rate in cr_ver.items():
-                    lines.append(
-                        f"    {ver}: "
-                        f"{f'{rate:.2%}' if rate is not None else 'N/A'}"
-                    )
+    def _session_lookup(self, field: str) -> pd.Series:
+        """device_id -> first non-null session value of field, memoized.
 
-            self._fmt_distribution(
-                lines,
-                "Uptime before crash",
-                ca.get("uptime_distribution_before_crash"),
-            )
+        The cache entry is rebuilt if self.sessions has been replaced since.
+        """
+        cached = self._session_lut_cache.get(field)
+        if cached is not None and cached[0] is self.sessions:
+            return cached[1]
+        lut = self.sessions.groupby("device_id")[field].first()
+        self._session_lut_cache[field] = (self.sessions, lut)
+        return lut
 
-        # Updates
-        ua = metrics.get("update_analysis", {})
-        if not ua.get("note"):
-            lines.append(f"\n{sep}")
-            lines.append(
-                f"  UPDATES: {ua.get('total_attempts', 0)} attempts, "
-                f"{ua.get('successes', 0)} succeeded, "
-                f"{ua.get('failures', 0)} failed "
-                f"({ua.get('success_rate', 0):.0f}% success rate)"
-            )
-            lines.append(sep)
-            self._fmt_distribution(
-                lines,
-                "Failure reasons",
-                ua.get("failure_reasons"),
-            )
-            self._fmt_distribution(
-                lines,
-                "Failures by platform",
-                ua.get("failures_by_platform"),
-            )
+    @staticmethod
+    def _prefixed_column_totals(df: pd.DataFrame, prefix: str) -> dict:
+        """Sum every "prefix.*" column in one 2-D reduction, largest first."""
+        cols = [c for c in df.columns if c.startswith(prefix)]
+        if not cols:
+            return {}
+        totals = (
+            df[cols]
+            .apply(pd.to_numeric, errors="coerce")
+            .fillna(0)
+            .sum(axis=0)
+            .astype(int)
+        )
+        totals.index = totals.index.str.removeprefix(prefix)
+        return totals.sort_values(ascending=False, kind="stable").to_dict()
+
+    def _value_counts(self, df: pd.DataFrame, column: str) -> pd.Series:
+        """Non-null value_counts of a column, unsorted, memoized per frame.
+
+        Values are in first-appearance (or category) order; callers sort.
+        """
+        key = (id(df), column)
+        cached = self._col_cache.get(key)
+        # Holding the frame keeps its id from being reused by another one
+        if cached is not None and cached[0] is df:
+            return cached[1]
+        counts = df[column].dropna().value_counts(sort=False)
+        if isinstance(counts.index, pd.CategoricalIndex):
+            # Categorical value_counts() also lists unobserved categories
+            counts = counts[counts > 0]
+        self._col_cache[key] = (df, counts)
+        return counts
 
-        # Memory analysis
-        mem = metrics.get("memory_analysis", {})
-        if not mem.get("note"):
-            lines.append(f"\n{sep}")
-            lines.append("  MEMORY ANALYSIS")
-            lines.append(sep)
-            lines.append(
-                f"  Total snapshots: {mem.get('total_snapshots', 0)}"
-            )
-            for col in (
-                "rss_kb",
-                "vm_size_kb",
-                "vm_peak_kb",
-                "vm_hwm_kb",
-            ):
-                mean = mem.get(f"{col}_mean")
-                mx = mem.get(f"{col}_max")
-                p95 = mem.get(f"{col}_p95")
-                if mean is not None:
-                    lines.append(
-                        f"  {col}: mean={mean:.0f}"
-                        f" max={mx:.0f} p95={p95:.0f}"
-                    )
+    def _distribution(
+        self, df: pd.DataFrame, column: str, top: Optional[int] = None
+    ) -> dict:
+        """Compute value_counts for a column, optionally top-N."""
+        if column not in df.columns or (top is not None and top <= 0):
+            return {}
+        counts = self._value_counts(df, column)
+        if top is not None and top < 50:
+            # Partial selection; keep="first" breaks ties in the same
+            # appearance order a full stable sort would
+            counts = counts.nlargest(top, keep="first")
+        else:
+            counts = counts.sort_values(ascending=False, kind="stable")
+            if top is not None:
+                counts = counts.head(top)
+        # Two batch tolist() conversions instead of per-pair to_dict()
+        return dict(zip(counts.index.tolist(), counts.tolist()))
 
-        # Hardware analysis
-        hw = metrics.get("hardware_analysis", {})
-        if not hw.get("note"):
-            lines.append(f"\n{sep}")
-            lines.append("  HARDWARE ANALYSIS")
-            lines.append(sep)
-            lines.append(
-                f"  Total profiles: {hw.get('total_profiles', 0)}"
-            )
-            self._fmt_distribution(
-                lines,
-                "Printer model (top 20)",
-                hw.get("printer_model_distribution"),
-            )
-            self._fmt_distribution(
-                lines,
-                "Kinematics",
-                hw.get("kinematics_distribution"),
-            )
-            self._fmt_distribution(
-                lines,
-                "Primary MCU (top 10)",
-                hw.get("primary_mcu_distribution"),
-            )
-            self._fmt_distribution(
-                lines,
-                "Extruder count",
-                hw.get("extruder_count_distribution"),
-            )
-            self._fmt_distribution(
-                lines,
-                "AMS type",
-                hw.get("ams_type_distribution"),
-            )
-            self._fmt_distribution(
-                lines,
-                "Display backend",
-                hw.get("display_backend_distribution"),
-            )
-            # Capability adoption percentages
-            cap_lines = []
-            for cap in (
-                "capabilities.has_chamber",
-                "capabilities.has_accelerometer",
-                "capabilities.has_firmware_retraction",
-                "capabilities.has_exclude_object",
-                "capabilities.has_timelapse",
-                "capabilities.has_klippain_shaketune",
-                "probe.has_probe",
-                "probe.has_bed_mesh",
-                "probe.has_qgl",
-            ):
-                pct = hw.get(f"{cap}_pct")
-                if pct is not None:
-                    cap_lines.append(
-                        f"    {cap.split('.')[-1]}: {pct}%"
-                    )
-            if cap_lines:
-                lines.append("\n  Capability adoption (%):")
-                lines.extend(cap_lines)
-
-        # Settings analysis
-        sa = metrics.get("settings_analysis", {})
-        if not sa.get("note"):
-            lines.append(f"\n{sep}")
-            lines.append("  SETTINGS ANALYSIS")
-            lines.append(sep)
-            lines.append(
-                f"  Total snapshots: {sa.get('total_snapshots', 0)}"
-            )
-            self._fmt_distribution(
-                lines, "Theme", sa.get("theme_distribution")
-            )
-            self._fmt_distribution(
-                lines, "Locale", sa.get("locale_distribution")
-            )
-            self._fmt_distribution(
-                lines,
-                "Time format",
-                sa.get("time_format_distribution"),
-            )
-            bm = sa.get("brightness_mean")
-            if bm is not None:
-                lines.append(f"\n  Average brightness: {bm:.0f}%")
-
-        # Panel usage
-        pu = metrics.get("panel_usage_analysis", {})
-        if not pu.get("note"):
-            lines.append(f"\n{sep}")
-            lines.append("  PANEL USAGE")
-            lines.append(sep)
-            lines.append(
-                f"  Sessions with usage data: "
-                f"{pu.get('total_sessions', 0)}"
-            )
-            avg_dur = pu.get("avg_session_duration_sec")
-            if avg_dur:
-                lines.append(
-                    f"  Avg session duration: "
-                    f"{self._fmt_duration(avg_dur)}"
-                )
-            self._fmt_distribution(
-                lines,
-                "Total time by panel (sec)",
-                pu.get("total_time_by_panel_sec"),
-            )
-            self._fmt_distribution(
-                lines,
-                "Total visits by panel",
-                pu.get("total_visits_by_panel"),
-            )
+    @staticmethod
+    def _bool_pct(df: pd.DataFrame, column: str) -> float:
+        """Percentage of non-null values in a column that are True."""
+        col = df[column]
+        if isinstance(col.dtype, pd.BooleanDtype):
+            total = int(col.notna().sum())
+            vals = col.to_numpy(dtype=bool, na_value=False)
+        else:
+            vals = col.dropna().to_numpy()
+            total = len(vals)
+            if vals.dtype != bool:
+                vals = vals == True  # noqa: E712
+        if total == 0:
+            return 0
+        return round(np.count_nonzero(vals) / total * 100, 1)
 
-        # Connection stability
-        cs = metrics.get("connection_analysis", {})
-        if not cs.get("note"):
-            lines.append(f"\n{sep}")
-            lines.append("  CONNECTION STABILITY")
-            lines.append(sep)
-            lines.append(
-                f"  Sessions: {cs.get('total_sessions', 0)}"
-            )
-            pct = cs.get("overall_connected_pct")
-            if pct is not None:
-                lines.append(f"  Overall connected: {pct:.1f}%")
-            for col in (
-                "connect_count",
-                "disconnect_count",
-                "klippy_error_count",
-                "klippy_shutdown_count",
-            ):
-                total = cs.get(f"{col}_total")
-                mean = cs.get(f"{col}_mean")
-                if total is not None:
-                    lines.append(
-                        f"  {col}: total={total}"
-                        f" mean={mean:.2f}/session"
-                    )
-            ld = cs.get("longest_disconnect_max_sec")
-            if ld is not None:
-                lines.append(
-                    f"  Longest disconnect: "
-                    f"{self._fmt_duration(ld)}"
-                )
+    @staticmethod
+    def _success_mask(df: pd.DataFrame) -> pd.Series:
+        """Boolean "outcome == success" per row, precomputed when loaded."""
+        if "_is_success" in df.columns:
+            return df["_is_success"]
+        # Nullable string columns compare to <NA> on a missing outcome
+        return df["outcome"].eq("success").fillna(False).astype(bool)
+
+    @classmethod
+    def _success_rate_by(
+        cls, df: pd.DataFrame, column: str, min_count: int = 1
+    ) -> dict:
+        """Compute success rate grouped by a column."""
+        if column not in df.columns or "outcome" not in df.columns:
+            return {}
+        # One factorize + two bincounts instead of a groupby per call
+        codes, names = pd.factorize(df[column])
+        valid = codes >= 0
+        codes = codes[valid]
+        ok = cls._success_mask(df).to_numpy()[valid]
+        totals = np.bincount(codes, minlength=len(names))
+        successes = np.bincount(codes, weights=ok, minlength=len(names))
+        # Visit groups in sorted key order, as groupby() did, even when the
+        # column is categorical with categories in appearance order
+        names = np.asarray(names)
+        rates = np.round(successes / np.maximum(totals, 1) * 100, 1)
+        groups = pd.Index(names).argsort()
+        groups = groups[totals[groups] >= min_count]
+        order = groups[np.argsort(-rates[groups], kind="stable")]
+        return {
+            str(names[i]): {"rate": float(rates[i]), "total": int(totals[i])}
+            for i in order
+        }
 
-        # Print start context
-        ps = metrics.get("print_start_analysis", {})
-        if not ps.get("note"):
-            lines.append(f"\n{sep}")
-            lines.append("  PRINT START CONTEXT")
-            lines.append(sep)
-            lines.append(
-                f"  Total print starts: "
-                f"{ps.get('total_print_starts', 0)}"
-            )
-            tp = ps.get("thumbnail_pct")
-            if tp is not None:
-                lines.append(f"  Has thumbnail: {tp:.1f}%")
-            ap = ps.get("ams_active_pct")
-            if ap is not None:
-                lines.append(f"  AMS active: {ap:.1f}%")
-            self._fmt_distribution(
-                lines, "Source", ps.get("source_distribution")
-            )
-            self._fmt_distribution(
-                lines,
-                "Slicer (top 10)",
-                ps.get("slicer_distribution"),
-            )
-            self._fmt_distribution(
-                lines,
-                "File size",
-                ps.get("file_size_distribution"),
-            )
-            self._fmt_distribution(
-                lines,
-                "Estimated duration",
-                ps.get("duration_estimate_distribution"),
-            )
+    @staticmethod
+    def _fmt_distribution(
+        lines: list[str], title: str, data: Optional[dict]
+    ) -> None:
+        if not data:
+            return
+        lines.append(f"\n  {title}:")
+        for key, count in data.items():
+            lines.append(f"    {key}: {count}")
 
-        # Error analysis
-        ea = metrics.get("error_analysis", {})
-        if not ea.get("note"):
-            lines.append(f"\n{sep}")
-            lines.append("  ERROR ANALYSIS")
-            lines.append(sep)
-            lines.append(
-                f"  Total errors: {ea.get('total_errors', 0)}"
-            )
-            self._fmt_distribution(
-                lines,
-                "By category",
-                ea.get("errors_by_category"),
-            )
-            self._fmt_distribution(
-                lines,
-                "By code (top 10)",
-                ea.get("errors_by_code"),
-            )
-            self._fmt_distribution(
-                lines,
-                "By context (top 10)",
-                ea.get("errors_by_context"),
-            )
+    @staticmethod
+    def _fmt_percentages(
+        lines: list[str], title: str, data: Optional[dict]
+    ) -> None:
+        if not data:
+            return
+        lines.append(f"\n  {title}:")
+        for key, pct in data.items():
+            lines.append(f"    {key}: {pct}%")
 
-        lines.append(f"\n{sep}")
-        return "\n".join(lines)
+    _fmt_ratio = staticmethod(fmt_ratio)
+    _fmt_duration = staticmethod(fmt_duration)
 
-    def format_json(self, metrics: dict) -> str:
-        return json.dumps(metrics, indent=2, default=str)
 
-    def format_html(self, metrics: dict, output_path: str) -> None:
-        json_str = self.format_json(metrics)
-        terminal_str = self.format_terminal(metrics)
-        generated_at = metrics.get("generated_at", "")
-        html = f"""<!DOCTYPE html>
+# Self-contained HTML report; $terminal and $json are the rendered reports
+HTML_TEMPLATE = string.Template(
+    """<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="utf-8">
 <meta name="viewport" content="width=device-width, initial-scale=1">
 <title>HelixScreen Telemetry Report</title>
 <style>
-  body {{
+  body {
     font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
     max-width: 960px; margin: 2rem auto; padding: 0 1rem;
     background: #1a1a2e; color: #e0e0e0;
-  }}
-  h1 {{ color: #00d4ff; border-bottom: 2px solid #00d4ff; padding-bottom: 0.5rem; }}
-  h2 {{ color: #00d4ff; margin-top: 2rem; }}
-  pre {{
+  }
+  h1 { color: #00d4ff; border-bottom: 2px solid #00d4ff; padding-bottom: 0.5rem; }
+  h2 { color: #00d4ff; margin-top: 2rem; }
+  pre {
     background: #16213e; padding: 1rem; border-radius: 8px;
     overflow-x: auto; font-size: 0.85rem; line-height: 1.4;
     white-space: pre-wrap;
-  }}
-  .meta {{ color: #888; font-size: 0.9rem; }}
-  .tabs {{ display: flex; gap: 0.5rem; margin: 1rem 0; }}
-  .tab {{
+  }
+  .meta { color: #888; font-size: 0.9rem; }
+  .tabs { display: flex; gap: 0.5rem; margin: 1rem 0; }
+  .tab {
     padding: 0.5rem 1rem; cursor: pointer; border-radius: 4px;
     background: #16213e; border: 1px solid #333;
-  }}
-  .tab.active {{ background: #00d4ff; color: #1a1a2e; font-weight: bold; }}
-  .tab-content {{ display: none; }}
-  .tab-content.active {{ display: block; }}
+  }
+  .tab.active { background: #00d4ff; color: #1a1a2e; font-weight: bold; }
+  .tab-content { display: none; }
+  .tab-content.active { display: block; }
 </style>
 </head>
 <body>
 <h1>HelixScreen Telemetry Report</h1>
-<p class="meta">Generated: {generated_at}</p>
+<p class="meta">Generated: $generated_at</p>
 <p class="meta">Charts will be added in a future version.</p>
 
 <div class="tabs">
@@ -1440,100 +1929,25 @@ class TelemetryAnalyzer:
 </div>
 
 <div id="tab-summary" class="tab-content active">
-<pre>{terminal_str}</pre>
+<pre>$terminal</pre>
 </div>
 
 <div id="tab-json" class="tab-content">
-<pre>{json_str}</pre>
+<pre>$json</pre>
 </div>
 
 <script>
-function showTab(name) {{
+function showTab(name) {
   document.querySelectorAll('.tab-content').forEach(el => el.classList.remove('active'));
   document.querySelectorAll('.tab').forEach(el => el.classList.remove('active'));
   document.getElementById('tab-' + name).classList.add('active');
   event.target.classList.add('active');
-}}
+}
 </script>
 </body>
 </html>
 """
-        with open(output_path, "w") as f:
-            f.write(html)
-        print(f"HTML report written to {output_path}", file=sys.stderr)
-
-    # -- Helpers -----------------------------------------------------------
-
-    def _join_session_field(
-        self, df: pd.DataFrame, field: str
-    ) -> pd.DataFrame:
-        """Join a session field onto another dataframe by device_id."""
-        if field not in self.sessions.columns:
-            return df
-        device_map = self.sessions.groupby("device_id")[field].first()
-        result = df.copy()
-        result[field] = result["device_id"].map(device_map)
-        return result
-
-    @staticmethod
-    def _distribution(
-        df: pd.DataFrame, column: str, top: Optional[int] = None
-    ) -> dict:
-        """Compute value_counts for a column, optionally top-N."""
-        if column not in df.columns:
-            return {}
-        counts = df[column].dropna().value_counts()
-        if top is not None:
-            counts = counts.head(top)
-        return counts.to_dict()
-
-    @staticmethod
-    def _success_rate_by(
-        df: pd.DataFrame, column: str, min_count: int = 1
-    ) -> dict:
-        """Compute success rate grouped by a column."""
-        if column not in df.columns or "outcome" not in df.columns:
-            return {}
-        grouped = df.groupby(column)
-        result = {}
-        for name, group in grouped:
-            total = len(group)
-            if total < min_count:
-                continue
-            successes = (group["outcome"] == "success").sum()
-            result[str(name)] = {
-                "rate": round(successes / total * 100, 1),
-                "total": total,
-            }
-        return dict(sorted(result.items(), key=lambda x: -x[1]["rate"]))
-
-    @staticmethod
-    def _fmt_distribution(
-        lines: list[str], title: str, data: Optional[dict]
-    ) -> None:
-        if not data:
-            return
-        lines.append(f"\n  {title}:")
-        for key, count in data.items():
-            lines.append(f"    {key}: {count}")
-
-    @staticmethod
-    def _fmt_percentages(
-        lines: list[str], title: str, data: Optional[dict]
-    ) -> None:
-        if not data:
-            return
-        lines.append(f"\n  {title}:")
-        for key, pct in data.items():
-            lines.append(f"    {key}: {pct}%")
-
-    @staticmethod
-    def _fmt_duration(seconds: float) -> str:
-        if seconds < 60:
-            return f"{seconds:.0f}s"
-        if seconds < 3600:
-            return f"{seconds / 60:.1f}min"
-        return f"{seconds / 3600:.1f}hr"
+)
 
 
 def find_project_root() -> Path:
@@ -1575,6 +1989,12 @@ def main():
         metavar="PATH",
         help="Override default data directory",
     )
+    parser.add_argument(
+        "--engine",
+        choices=("pandas", "arrow"),
+        default="pandas",
+        help="Event flattening engine (arrow requires pyarrow)",
+    )
     args = parser.parse_args()
 
     if args.data_dir:
@@ -1583,8 +2003,16 @@ def main():
         root = find_project_root()
         data_dir = str(root / ".telemetry-data" / "events")
 
+    # Checked before anything imports pandas
+    if not Path(data_dir).is_dir():
+        print(f"Data directory not found: {data_dir}", file=sys.stderr)
+        print("No data.", file=sys.stderr)
+        sys.exit(0)
+
     analyzer = TelemetryAnalyzer()
-    analyzer.load_events(data_dir, since=args.since, until=args.until)
+    analyzer.load_events(
+        data_dir, since=args.since, until=args.until, engine=args.engine
+    )
 
     if analyzer.all_events.empty:
         print("No data.", file=sys.stderr)
@@ -1595,9 +2023,10 @@ def main():
     if args.json:
         print(analyzer.format_json(metrics))
     elif args.html:
-        analyzer.format_html(metrics, args.html)
-        # Also print terminal output
-        print(analyzer.format_terminal(metrics))
+        # Render the terminal report once; it goes in the HTML and to stdout
+        terminal_str = analyzer.format_terminal(metrics)
+        analyzer.format_html(metrics, args.html, terminal_str=terminal_str)
+        print(terminal_str)
     else:
         print(analyzer.format_terminal(metrics))
 
@@ -6,7 +6,7 @@ Translation Sync Tool - manage translation string lifecycle.
 Usage:
     python translation_sync.py sync [--dry-run] [--with-sources]
     python translation_sync.py extract
-    python translation_sync.py coverage [--fail-under PCT]
+    python translation_sync.py coverage [--fail-under PCT] [--fail-fast]
     python translation_sync.py obsolete [--action ACTION] [--dry-run]
 
 Commands:
@@ -19,7 +19,14 @@ Options:
     --dry-run        Don't modify files, just show what would change
     --with-sources   Add source file comments when merging
     --fail-under     Fail if coverage below threshold (default: 0)
+    --fail-fast      For coverage: stop at the first language below threshold,
+                     skipping the full report
     --action         For obsolete: report, mark, or delete (default: report)
+
+Environment:
+    HELIX_YAML_CACHE=1  Cache parsed YAML for read-only use under
+                        $XDG_CACHE_HOME/helixscreen/translations (default
+                        ~/.cache), so later runs skip re-parsing
 """
 
 import argparse
@@ -112,11 +119,29 @@ def cmd_coverage(args):
         print(f"Error: YAML directory not found: {yaml_dir}")
         return 1
 
-    report = generate_coverage_report(yaml_dir, show_missing=args.show_missing)
+    result = None
+    if args.fail_under > 0:
+        result = run_coverage(
+            yaml_dir, fail_under=args.fail_under, fail_fast=args.fail_fast
+        )
+        if result.truncated:
+            # --fail-fast stopped at the first failing language, so there
+            # are no full stats to report
+            locale = next(reversed(result.stats))
+            print(
+                f"✗ {locale} coverage {result.min_coverage:.1f}% below threshold "
+                f"{args.fail_under}% (stopped at first failure)"
+            )
+            return 1
+
+    report = generate_coverage_report(
+        yaml_dir,
+        show_missing=args.show_missing,
+        stats=result.stats if result is not None else None,
+    )
     print(report)
 
-    if args.fail_under > 0:
-        result = run_coverage(yaml_dir, fail_under=args.fail_under)
+    if result is not None:
         if not result.passed:
             print(f"\n✗ Coverage {result.min_coverage:.1f}% below threshold {args.fail_under}%")
             return 1
@@ -161,7 +186,7 @@ def cmd_obsolete(args):
             print(f"Marked {result.deleted} keys as deprecated.")
     elif args.action == "delete":
         if args.dry_run:
-            print(f"Would delete {len(result.obsolete_keys)} keys from all YAML files.")
+            print(f"Would delete {result.would_delete} key instances from YAML files.")
         else:
             print(f"Deleted {result.deleted} key instances from YAML files.")
 
@@ -217,6 +242,12 @@ def main():
         default=0,
         help="Fail if coverage below this percentage",
     )
+    coverage_parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop checking at the first language below --fail-under, "
+        "without printing the full report",
+    )
     coverage_parser.add_argument(
         "--show-missing",
         action="store_true",
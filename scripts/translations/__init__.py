@@ -14,9 +14,11 @@ from .yaml_manager import (
     merge_new_keys,
     merge_new_keys_with_sources,
     load_yaml_file,
+    load_yaml_translation_keys,
 )
 from .coverage import (
     calculate_coverage,
+    calculate_coverage_iter,
     get_missing_translations,
     generate_coverage_report,
 )
@@ -37,7 +39,9 @@ __all__ = [
     "merge_new_keys",
     "merge_new_keys_with_sources",
     "load_yaml_file",
+    "load_yaml_translation_keys",
     "calculate_coverage",
+    "calculate_coverage_iter",
     "get_missing_translations",
     "generate_coverage_report",
     "find_obsolete_keys",
@@ -4,17 +4,23 @@
 CLI module - command-line interface for translation sync operations.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Set, Dict, Any, List
+from typing import AbstractSet, Set, Dict, Any, List, Optional, Union
 
 from .extractor import (
     extract_strings_from_directory,
     extract_strings_with_all_locations,
     extract_strings_from_cpp_directory,
 )
-from .yaml_manager import merge_new_keys, merge_new_keys_with_sources, load_yaml_file
-from .coverage import calculate_coverage, generate_coverage_report
+from .yaml_manager import (
+    merge_new_keys,
+    merge_new_keys_with_sources,
+    load_yaml_translation_keys,
+)
+from .coverage import calculate_coverage_iter, generate_coverage_report
 from .obsolete import find_obsolete_keys, report_obsolete_keys, mark_obsolete_keys, delete_obsolete_keys
 
 
@@ -43,6 +49,8 @@ class CoverageResult:
     passed: bool = True
     stats: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     min_coverage: float = 0.0
+    # True when fail_fast stopped early; stats and min_coverage are partial
+    truncated: bool = False
 
 
 @dataclass
@@ -55,12 +63,13 @@ class ObsoleteResult:
 
 
 def run_sync(
-    xml_dir: Path,
-    yaml_dir: Path,
+    xml_dir: Union[str, Path],
+    yaml_dir: Union[str, Path],
     dry_run: bool = True,
     with_sources: bool = False,
     base_locale: str = "en",
-    cpp_dir: Path = None,
+    cpp_dir: Union[str, Path] = None,
+    existing_keys: Optional[AbstractSet[str]] = None,
 ) -> SyncResult:
     """
     Run the full sync workflow: extract from XML and C++, merge to YAML.
@@ -72,56 +81,107 @@ def run_sync(
         with_sources: If True, add source file comments
         base_locale: Base locale for comparison
         cpp_dir: Optional directory containing C++ source files
+        existing_keys: Keys of the base locale, if the caller already has
+            them; the base YAML file is then not read. The caller is
+            responsible for them matching the file on disk.
 
     Returns:
         SyncResult with statistics
     """
+    # Plain string paths from here on; the helpers below accept either
+    xml_dir = os.fspath(xml_dir)
+    yaml_dir = os.fspath(yaml_dir)
+    cpp_dir = os.fspath(cpp_dir) if cpp_dir else None
+
     result = SyncResult()
 
-    # Extract strings from XML
+    # Extract strings from XML, and from C++ if a directory was provided.
+    # The two trees are independent, so scan them concurrently.
     if with_sources:
-        strings_with_sources = extract_strings_with_all_locations(xml_dir, recursive=True)
-        new_keys = set(strings_with_sources.keys())
+        extract_xml = extract_strings_with_all_locations
+    else:
+        extract_xml = extract_strings_from_directory
+
+    if cpp_dir and os.path.exists(cpp_dir):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            xml_future = pool.submit(extract_xml, xml_dir, recursive=True)
+            cpp_future = pool.submit(
+                extract_strings_from_cpp_directory, cpp_dir, recursive=True
+            )
+            xml_strings = xml_future.result()
+            cpp_strings = cpp_future.result()
     else:
-        new_keys = extract_strings_from_directory(xml_dir, recursive=True)
-
-    # Also extract from C++ if directory provided
-    if cpp_dir and cpp_dir.exists():
-        cpp_strings = extract_strings_from_cpp_directory(cpp_dir, recursive=True)
-        new_keys.update(cpp_strings)
-
-    # Get existing keys from YAML
-    base_path = yaml_dir / f"{base_locale}.yml"
-    if base_path.exists():
-        base_data = load_yaml_file(base_path)
-        existing_keys = set((base_data.get("translations") or {}).keys())
+        xml_strings = extract_xml(xml_dir, recursive=True)
+        cpp_strings = None
+
+    if with_sources:
+        strings_with_sources = xml_strings
+        # Set operations work on the keys view directly; no copy needed
+        new_keys = strings_with_sources.keys()
     else:
-        existing_keys = set()
+        new_keys = xml_strings
+
+    if cpp_strings:
+        # In-place for a set; a keys view is replaced by the union set
+        new_keys |= cpp_strings
+
+    # Get existing keys from YAML, unless the caller supplied them
+    if existing_keys is None:
+        base_path = os.path.join(yaml_dir, f"{base_locale}.yml")
+        if os.path.exists(base_path):
+            # Interned keys, so lookups of the interned extracted strings can
+            # match by identity
+            existing_keys = load_yaml_translation_keys(base_path)
+        else:
+            existing_keys = frozenset()
 
-    # Find truly new keys
-    truly_new = new_keys - existing_keys
-    result.new_keys_found = len(truly_new)
+    # Find truly new keys. In the usual no-new-strings case this is only a
+    # membership scan; the difference set is built when there is something
+    # to merge.
+    if any(k not in existing_keys for k in new_keys):
+        truly_new = new_keys - existing_keys
+        result.new_keys_found = len(truly_new)
 
-    # Merge new keys
-    if truly_new:
+        # Merge new keys
         if with_sources:
-            # Filter to only new keys
-            new_sources = {k: v for k, v in strings_with_sources.items() if k in truly_new}
-            merge_result = merge_new_keys_with_sources(yaml_dir, new_sources, dry_run=dry_run)
+            # Only the new keys, skipping C++ strings that have no XML source,
+            # in extraction order so the merge doesn't depend on set order.
+            # Sources are looked up lazily, only for comments actually written.
+            merge_result = merge_new_keys_with_sources(
+                yaml_dir,
+                [k for k in strings_with_sources if k in truly_new],
+                dry_run=dry_run,
+                get_sources=lambda k: strings_with_sources[k],
+            )
         else:
             merge_result = merge_new_keys(yaml_dir, truly_new, dry_run=dry_run)
 
         result.keys_added = merge_result.keys_added
         result.files_modified = merge_result.files_modified
 
-    # Check for obsolete keys (include C++ sources for accurate count)
-    obsolete = find_obsolete_keys(xml_dir, yaml_dir, base_locale, cpp_dir=cpp_dir)
-    result.obsolete_keys_found = len(obsolete)
+    # Check for obsolete keys against the XML and C++ strings and base keys
+    # gathered above. Keys merged in plain mode are all source strings, so
+    # they can never be obsolete. The location-tracking extractor keeps text
+    # on bind_text lines, so with sources the obsolete check scans the trees
+    # and re-reads the base file itself to match run_obsolete.
+    if with_sources:
+        source_keys = base_keys = None
+    else:
+        source_keys, base_keys = new_keys, existing_keys
+    result.obsolete_keys_found = find_obsolete_keys(
+        xml_dir,
+        yaml_dir,
+        base_locale,
+        cpp_dir=cpp_dir,
+        source_keys=source_keys,
+        count_only=True,
+        existing_keys=base_keys,
+    )
 
     return result
 
 
-def run_extract(xml_dir: Path, recursive: bool = True) -> ExtractResult:
+def run_extract(xml_dir: Union[str, Path], recursive: bool = True) -> ExtractResult:
     """
     Extract and list all translatable strings from XML files.
 
@@ -132,15 +192,16 @@ def run_extract(xml_dir: Path, recursive: bool = True) -> ExtractResult:
     Returns:
         ExtractResult with strings found
     """
-    strings = extract_strings_from_directory(xml_dir, recursive=recursive)
+    strings = extract_strings_from_directory(os.fspath(xml_dir), recursive=recursive)
 
     return ExtractResult(strings=strings, total_count=len(strings))
 
 
 def run_coverage(
-    yaml_dir: Path,
+    yaml_dir: Union[str, Path],
     fail_under: float = 0.0,
     base_locale: str = "en",
+    fail_fast: bool = False,
 ) -> CoverageResult:
     """
     Check translation coverage.
@@ -149,17 +210,23 @@ def run_coverage(
         yaml_dir: Directory containing YAML translation files
         fail_under: Minimum coverage percentage required (0-100)
         base_locale: Base locale for comparison
+        fail_fast: If True, stop reading at the first locale below fail_under.
+            The result is then marked truncated: its stats and min_coverage
+            only cover the locales read so far.
 
     Returns:
         CoverageResult with stats and pass/fail status
     """
-    stats = calculate_coverage(yaml_dir, base_locale)
+    yaml_dir = os.fspath(yaml_dir)
+    stats: Dict[str, Dict[str, Any]] = {}
 
-    # Check if all languages meet minimum
+    # Check if all languages meet minimum while the stats are being read
     passed = True
+    truncated = False
     min_coverage = 100.0
 
-    for locale, locale_stats in stats.items():
+    for locale, locale_stats in calculate_coverage_iter(yaml_dir, base_locale):
+        stats[locale] = locale_stats
         if locale == base_locale:
             continue  # Skip base locale
 
@@ -168,17 +235,22 @@ def run_coverage(
 
         if pct < fail_under:
             passed = False
+            if fail_fast:
+                truncated = True
+                break
 
-    return CoverageResult(passed=passed, stats=stats, min_coverage=min_coverage)
+    return CoverageResult(
+        passed=passed, stats=stats, min_coverage=min_coverage, truncated=truncated
+    )
 
 
 def run_obsolete(
-    xml_dir: Path,
-    yaml_dir: Path,
+    xml_dir: Union[str, Path],
+    yaml_dir: Union[str, Path],
     action: str = "report",
     dry_run: bool = True,
     base_locale: str = "en",
-    cpp_dir: Path = None,
+    cpp_dir: Union[str, Path] = None,
 ) -> ObsoleteResult:
     """
     Detect and optionally handle obsolete translation keys.
@@ -194,6 +266,10 @@ def run_obsolete(
     Returns:
         ObsoleteResult with obsolete keys and action results
     """
+    xml_dir = os.fspath(xml_dir)
+    yaml_dir = os.fspath(yaml_dir)
+    cpp_dir = os.fspath(cpp_dir) if cpp_dir else None
+
     obsolete = find_obsolete_keys(xml_dir, yaml_dir, base_locale, cpp_dir=cpp_dir)
 
     result = ObsoleteResult(obsolete_keys=obsolete)
@@ -209,11 +285,11 @@ def run_obsolete(
             result.deleted = marked
 
     elif action == "delete":
-        # Count how many would be deleted
-        result.would_delete = len(obsolete) * len(list(yaml_dir.glob("*.yml")))
-
+        # One pass counts the key instances actually present in each file;
+        # the count is the same whether or not the files are rewritten
+        deleted = delete_obsolete_keys(yaml_dir, obsolete, dry_run=dry_run)
+        result.would_delete = deleted
         if not dry_run:
-            deleted = delete_obsolete_keys(yaml_dir, obsolete, dry_run=False)
             result.deleted = deleted
 
     return result
@@ -4,11 +4,12 @@
 Coverage module - calculates translation coverage statistics.
 """
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Set, Any
+from typing import Dict, Iterator, List, Optional, Set, Any, Tuple, Union
 
-from .yaml_manager import load_yaml_file
+from .yaml_manager import _list_yaml_files, load_yaml_file, load_yaml_translation_keys
 
 
 @dataclass
@@ -34,30 +35,43 @@ def calculate_coverage(
     Returns:
         Dict mapping locale to stats dict with total, translated, missing, percentage
     """
-    result: Dict[str, Dict[str, Any]] = {}
+    return dict(calculate_coverage_iter(yaml_dir, base_locale))
 
+
+def calculate_coverage_iter(
+    yaml_dir: Union[str, Path], base_locale: str = "en"
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Calculate translation coverage, yielding each language as it is read.
+
+    Args:
+        yaml_dir: Directory containing translation YAML files
+        base_locale: The base language (considered 100% by definition)
+
+    Yields:
+        (locale, stats) tuples with total, translated, missing, percentage
+    """
     # First, get all keys from base locale
-    base_path = yaml_dir / f"{base_locale}.yml"
-    if not base_path.exists():
+    base_path = os.path.join(yaml_dir, f"{base_locale}.yml")
+    if not os.path.exists(base_path):
         # Find any YAML file as base
-        yaml_files = list(yaml_dir.glob("*.yml"))
+        yaml_files = _list_yaml_files(yaml_dir)
         if not yaml_files:
-            return result
+            return
         base_path = yaml_files[0]
 
-    base_data = load_yaml_file(base_path)
-    base_translations = base_data.get("translations", {})
-    total_keys = len(base_translations) if base_translations else 0
+    base_keys = load_yaml_translation_keys(base_path)
+    total_keys = len(base_keys)
 
     # Calculate stats for each language
-    for yaml_path in yaml_dir.glob("*.yml"):
-        data = load_yaml_file(yaml_path)
+    for yaml_path in _list_yaml_files(yaml_dir):
+        data = load_yaml_file(yaml_path, readonly=True)
         locale = data.get("locale", yaml_path.stem)
         translations = data.get("translations", {})
 
         if locale == base_locale:
             # Base locale is 100% by definition
-            result[locale] = {
+            yield locale, {
                 "total": total_keys,
                 "translated": total_keys,
                 "missing": 0,
@@ -67,7 +81,7 @@ def calculate_coverage(
             # Count non-empty translations
             translated = 0
             if translations:
-                for key in base_translations or {}:
+                for key in base_keys:
                     value = translations.get(key, "")
                     if value and str(value).strip():
                         translated += 1
@@ -75,18 +89,16 @@ def calculate_coverage(
             missing = total_keys - translated
             percentage = (translated / total_keys * 100) if total_keys > 0 else 100.0
 
-            result[locale] = {
+            yield locale, {
                 "total": total_keys,
                 "translated": translated,
                 "missing": missing,
                 "percentage": round(percentage, 1),
             }
 
-    return result
-
 
 def get_missing_translations(
-    yaml_dir: Path, base_locale: str = "en"
+    yaml_dir: Union[str, Path], base_locale: str = "en"
 ) -> Dict[str, List[str]]:
     """
     Get list of missing translations for each language.
@@ -101,19 +113,18 @@ def get_missing_translations(
     result: Dict[str, List[str]] = {}
 
     # Get base locale keys
-    base_path = yaml_dir / f"{base_locale}.yml"
-    if not base_path.exists():
+    base_path = os.path.join(yaml_dir, f"{base_locale}.yml")
+    if not os.path.exists(base_path):
         return result
 
-    base_data = load_yaml_file(base_path)
-    base_translations = base_data.get("translations", {})
+    base_keys = load_yaml_translation_keys(base_path)
 
-    if not base_translations:
+    if not base_keys:
         return result
 
     # Check each language
-    for yaml_path in yaml_dir.glob("*.yml"):
-        data = load_yaml_file(yaml_path)
+    for yaml_path in _list_yaml_files(yaml_dir):
+        data = load_yaml_file(yaml_path, readonly=True)
         locale = data.get("locale", yaml_path.stem)
 
         if locale == base_locale:
@@ -122,7 +133,7 @@ def get_missing_translations(
         translations = data.get("translations", {})
         missing = []
 
-        for key in base_translations:
+        for key in base_keys:
             value = translations.get(key, "") if translations else ""
             if not value or not str(value).strip():
                 missing.append(key)
@@ -134,7 +145,10 @@ def get_missing_translations(
 
 
 def generate_coverage_report(
-    yaml_dir: Path, base_locale: str = "en", show_missing: bool = False
+    yaml_dir: Path,
+    base_locale: str = "en",
+    show_missing: bool = False,
+    stats: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> str:
     """
     Generate a human-readable coverage report.
@@ -143,11 +157,13 @@ def generate_coverage_report(
         yaml_dir: Directory containing translation YAML files
         base_locale: The base language
         show_missing: Whether to list missing keys
+        stats: Coverage stats already computed for yaml_dir, if any
 
     Returns:
         Formatted report string
     """
-    stats = calculate_coverage(yaml_dir, base_locale)
+    if stats is None:
+        stats = calculate_coverage(yaml_dir, base_locale)
 
     if not stats:
         return "No translation files found."
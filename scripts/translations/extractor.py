@@ -20,10 +20,13 @@ Skips:
 - Code-like strings (paths, format strings, log messages)
 """
 
+import fnmatch
+import os
 import re
+import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Set, Dict, List, Tuple, Optional
+from typing import Iterator, Set, Dict, List, Tuple, Optional, Union
 
 # Attributes that contain translatable text
 TEXT_ATTRIBUTES = {"text", "label", "description", "title", "subtitle"}
@@ -89,7 +92,6 @@ CPP_SKIP_PATTERNS = [
     r"^%",  # Format strings
 ]
 
-
 def _decode_xml_entities(text: str) -> str:
     """Decode XML entities including numeric character references.
 
@@ -114,6 +116,20 @@ def _decode_xml_entities(text: str) -> str:
     return text
 
 
+def _iter_files(directory: Union[str, Path], pattern: str, recursive: bool) -> Iterator[str]:
+    """Yield paths of files matching a glob pattern, in Path.rglob() order.
+
+    Walks with os.scandir (via os.walk) and yields plain strings rather than
+    building a Path object for every entry.
+    """
+    for root, _dirs, files in os.walk(directory):
+        for name in files:
+            if fnmatch.fnmatchcase(name, pattern):
+                yield os.path.join(root, name)
+        if not recursive:
+            break
+
+
 def should_skip_text(text: str) -> bool:
     """Determine if text should be skipped (not translatable)."""
     if not text or not text.strip():
@@ -240,7 +256,7 @@ def should_skip_cpp_text(text: str) -> bool:
     return False
 
 
-def extract_strings_from_cpp(cpp_path: Path) -> Set[str]:
+def extract_strings_from_cpp(cpp_path: Union[str, Path]) -> Set[str]:
     """
     Extract translatable strings from a C++ source file.
 
@@ -269,7 +285,7 @@ def extract_strings_from_cpp(cpp_path: Path) -> Set[str]:
             # lv_tr() strings are explicitly marked - always include them
             if is_lv_tr:
                 if text and text.strip():
-                    result.add(text)
+                    result.add(sys.intern(text))
                 continue
 
             # Get surrounding context to check for skip patterns
@@ -288,13 +304,13 @@ def extract_strings_from_cpp(cpp_path: Path) -> Set[str]:
                 continue
 
             if not should_skip_cpp_text(text):
-                result.add(text)
+                result.add(sys.intern(text))
 
     return result
 
 
 def extract_strings_from_cpp_directory(
-    directory: Path, recursive: bool = True
+    directory: Union[str, Path], recursive: bool = True
 ) -> Set[str]:
     """
     Extract translatable strings from all C++ files in a directory.
@@ -310,14 +326,9 @@ def extract_strings_from_cpp_directory(
 
     patterns = ["*.cpp", "*.h"]
     for pattern in patterns:
-        if recursive:
-            cpp_files = directory.rglob(pattern)
-        else:
-            cpp_files = directory.glob(pattern)
-
-        for cpp_path in cpp_files:
+        for cpp_path in _iter_files(directory, pattern, recursive):
             # Skip generated files
-            if "generated" in str(cpp_path):
+            if "generated" in cpp_path:
                 continue
             strings = extract_strings_from_cpp(cpp_path)
             result.update(strings)
@@ -325,7 +336,7 @@ def extract_strings_from_cpp_directory(
     return result
 
 
-def extract_strings_from_xml(xml_path: Path) -> Set[str]:
+def extract_strings_from_xml(xml_path: Union[str, Path]) -> Set[str]:
     """
     Extract all translatable strings from an XML file.
 
@@ -383,7 +394,7 @@ def extract_strings_from_xml(xml_path: Path) -> Set[str]:
             text = _decode_xml_entities(text)
 
             if not should_skip_text(text):
-                result.add(text)
+                result.add(sys.intern(text))
 
     # Extract individual options from options_tag attributes
     # options_tag values use &#10; as separator in raw XML
@@ -396,12 +407,14 @@ def extract_strings_from_xml(xml_path: Path) -> Set[str]:
         for part in parts:
             decoded = _decode_xml_entities(part)
             if not should_skip_text(decoded):
-                result.add(decoded)
+                result.add(sys.intern(decoded))
 
     return result
 
 
-def extract_strings_with_locations(xml_path: Path) -> Dict[str, List[Tuple[str, int]]]:
+def extract_strings_with_locations(
+    xml_path: Union[str, Path],
+) -> Dict[str, List[Tuple[str, int]]]:
     """
     Extract translatable strings with their source locations.
 
@@ -422,7 +435,7 @@ def extract_strings_with_locations(xml_path: Path) -> Dict[str, List[Tuple[str,
         print(f"Warning: Failed to read {xml_path}: {e}")
         return result
 
-    filename = str(xml_path.name)
+    filename = os.path.basename(xml_path)
 
     # Parse with line tracking
     # Simple regex-based extraction for line numbers
@@ -448,7 +461,7 @@ def extract_strings_with_locations(xml_path: Path) -> Dict[str, List[Tuple[str,
             line_num = content[: match.start()].count("\n") + 1
 
             if text not in result:
-                result[text] = []
+                result[sys.intern(text)] = []
             result[text].append((filename, line_num))
 
     # Extract individual options from options_tag attributes
@@ -463,14 +476,14 @@ def extract_strings_with_locations(xml_path: Path) -> Dict[str, List[Tuple[str,
             if should_skip_text(decoded):
                 continue
             if decoded not in result:
-                result[decoded] = []
+                result[sys.intern(decoded)] = []
             result[decoded].append((filename, line_num))
 
     return result
 
 
 def extract_strings_from_directory(
-    directory: Path, recursive: bool = True, pattern: str = "*.xml"
+    directory: Union[str, Path], recursive: bool = True, pattern: str = "*.xml"
 ) -> Set[str]:
     """
     Extract translatable strings from all XML files in a directory.
@@ -485,12 +498,7 @@ def extract_strings_from_directory(
     """
     result = set()
 
-    if recursive:
-        xml_files = directory.rglob(pattern)
-    else:
-        xml_files = directory.glob(pattern)
-
-    for xml_path in xml_files:
+    for xml_path in _iter_files(directory, pattern, recursive):
         strings = extract_strings_from_xml(xml_path)
         result.update(strings)
 
@@ -498,7 +506,7 @@ def extract_strings_from_directory(
 
 
 def extract_strings_with_all_locations(
-    directory: Path, recursive: bool = True, pattern: str = "*.xml"
+    directory: Union[str, Path], recursive: bool = True, pattern: str = "*.xml"
 ) -> Dict[str, List[Tuple[str, int]]]:
     """
     Extract translatable strings with locations from all XML files in a directory.
@@ -513,12 +521,7 @@ def extract_strings_with_all_locations(
     """
     result: Dict[str, List[Tuple[str, int]]] = {}
 
-    if recursive:
-        xml_files = directory.rglob(pattern)
-    else:
-        xml_files = directory.glob(pattern)
-
-    for xml_path in xml_files:
+    for xml_path in _iter_files(directory, pattern, recursive):
         file_result = extract_strings_with_locations(xml_path)
         for text, locations in file_result.items():
             if text not in result:
@@ -4,16 +4,28 @@
 Obsolete module - detects and handles unused translation keys.
 """
 
+import os
 from pathlib import Path
-from typing import Set, Dict, Any
+from typing import AbstractSet, Set, Dict, Any, Optional, Union
 
 from .extractor import extract_strings_from_directory, extract_strings_from_cpp_directory
-from .yaml_manager import load_yaml_file, save_yaml_file
+from .yaml_manager import (
+    _list_yaml_files,
+    load_yaml_file,
+    load_yaml_translation_keys,
+    save_yaml_file,
+)
 
 
 def find_obsolete_keys(
-    xml_dir: Path, yaml_dir: Path, base_locale: str = "en", cpp_dir: Path = None
-) -> Set[str]:
+    xml_dir: Union[str, Path],
+    yaml_dir: Union[str, Path],
+    base_locale: str = "en",
+    cpp_dir: Union[str, Path] = None,
+    source_keys: Optional[Set[str]] = None,
+    count_only: bool = False,
+    existing_keys: Optional[AbstractSet[str]] = None,
+) -> Union[Set[str], int]:
     """
     Find translation keys that are not used in any XML or C++ file.
 
@@ -22,34 +34,39 @@ def find_obsolete_keys(
         yaml_dir: Directory containing translation YAML files
         base_locale: The base language to check keys from
         cpp_dir: Optional directory containing C++ source files
+        source_keys: Strings already extracted from xml_dir and cpp_dir.
+            When given, the source trees are not scanned again.
+        count_only: If True, return only the number of obsolete keys
+        existing_keys: Keys of the base locale, if the caller already has
+            them. When given, the base YAML file is not read.
 
     Returns:
-        Set of obsolete key names
+        Set of obsolete key names, or their count if count_only is set
     """
-    # Extract all strings used in XML
-    used_strings = extract_strings_from_directory(xml_dir, recursive=True)
+    if source_keys is not None:
+        used_strings = source_keys
+    else:
+        # Extract all strings used in XML
+        used_strings = extract_strings_from_directory(xml_dir, recursive=True)
 
-    # Also extract from C++ if directory provided
-    if cpp_dir and cpp_dir.exists():
-        cpp_strings = extract_strings_from_cpp_directory(cpp_dir, recursive=True)
-        used_strings.update(cpp_strings)
+        # Also extract from C++ if directory provided
+        if cpp_dir and os.path.exists(cpp_dir):
+            cpp_strings = extract_strings_from_cpp_directory(cpp_dir, recursive=True)
+            used_strings.update(cpp_strings)
 
-    # Get all keys from base locale YAML
-    base_path = yaml_dir / f"{base_locale}.yml"
-    if not base_path.exists():
-        return set()
+    if existing_keys is None:
+        # Get all keys from base locale YAML
+        base_path = os.path.join(yaml_dir, f"{base_locale}.yml")
+        if not os.path.exists(base_path):
+            return 0 if count_only else set()
 
-    base_data = load_yaml_file(base_path)
-    base_translations = base_data.get("translations", {})
+        existing_keys = load_yaml_translation_keys(base_path)
 
-    if not base_translations:
-        return set()
+    if count_only:
+        return sum(1 for k in existing_keys if k not in used_strings)
 
     # Find keys in YAML that aren't used in XML or C++
-    yaml_keys = set(base_translations.keys())
-    obsolete = yaml_keys - used_strings
-
-    return obsolete
+    return {k for k in existing_keys if k not in used_strings}
 
 
 def report_obsolete_keys(obsolete_keys: Set[str]) -> None:
@@ -89,7 +106,7 @@ def mark_obsolete_keys(
 
     marked = 0
 
-    for yaml_path in yaml_dir.glob("*.yml"):
+    for yaml_path in _list_yaml_files(yaml_dir):
         data = load_yaml_file(yaml_path)
         translations = data.get("translations", {})
 
@@ -132,7 +149,7 @@ def delete_obsolete_keys(
 
     deleted = 0
 
-    for yaml_path in yaml_dir.glob("*.yml"):
+    for yaml_path in _list_yaml_files(yaml_dir):
         data = load_yaml_file(yaml_path)
         translations = data.get("translations", {})
 
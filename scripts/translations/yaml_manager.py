@@ -6,12 +6,20 @@ YAML Manager module - handles merging new keys into translation YAML files.
 Uses ruamel.yaml for round-trip parsing to preserve comments and formatting.
 """
 
+import copy
+import hashlib
+import marshal
+import os
+import stat
+import sys
+import tempfile
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Set, Dict, List, Tuple, Optional, Any
+from typing import Callable, Collection, FrozenSet, Mapping, Set, Dict, List, Tuple, Optional, Any, Union
 
 try:
-    from ruamel.yaml import YAML
+    from ruamel.yaml import YAML, __version__ as _yaml_version
     from ruamel.yaml.comments import CommentedMap
 
     RUAMEL_AVAILABLE = True
@@ -19,6 +27,31 @@ except ImportError:
     RUAMEL_AVAILABLE = False
     import yaml as pyyaml
 
+    _yaml_version = pyyaml.__version__
+
+# Parsed YAML files keyed by path, validated against (mtime_ns, size).
+# Parsing dominates the runtime of the sync tooling and the same locale
+# files are read several times per invocation. The last slot holds the
+# translation key set once load_yaml_translation_keys() has asked for it.
+_YAML_CACHE_MAX = 100
+_yaml_cache: "OrderedDict[str, Tuple[int, int, Dict[str, Any], Optional[FrozenSet[str]]]]" = (
+    OrderedDict()
+)
+
+# Opt-in on-disk cache of parses for read-only loads, persisted across runs
+# when HELIX_YAML_CACHE=1. One marshal file per YAML path holds
+# (mtime_ns, size, data) with data reduced to plain dicts, lists and scalars,
+# so loading it never runs code. The tag keeps files from a different parser
+# or interpreter apart.
+_SIDE_CACHE_ENV = "HELIX_YAML_CACHE"
+_SIDE_CACHE_TAG = (
+    f"{'ruamel' if RUAMEL_AVAILABLE else 'pyyaml'}-{_yaml_version}"
+    f"-py{sys.version_info[0]}.{sys.version_info[1]}"
+)
+
+# *.yml listings keyed by directory, validated against the directory mtime
+_yaml_dir_cache: Dict[str, Tuple[int, Tuple[Path, ...]]] = {}
+
 
 @dataclass
 class MergeResult:
@@ -41,16 +74,36 @@ def get_yaml_instance():
     return yaml
 
 
-def load_yaml_file(yaml_path: Path) -> Dict[str, Any]:
+def _list_yaml_files(yaml_dir: Union[str, Path]) -> Tuple[Path, ...]:
     """
-    Load a YAML translation file.
+    List the *.yml files in a directory, in directory order.
+
+    The listing is cached until the directory's mtime changes, which happens
+    whenever an entry is added, removed or renamed.
 
     Args:
-        yaml_path: Path to the YAML file
+        yaml_dir: Directory containing translation YAML files
 
     Returns:
-        Dict with 'locale' and 'translations' keys
+        Tuple of paths to the YAML files
     """
+    key = os.fspath(yaml_dir)
+    mtime_ns = os.stat(key).st_mtime_ns
+
+    cached = _yaml_dir_cache.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    with os.scandir(key) as entries:
+        files = tuple(
+            Path(e.path) for e in entries if e.name.endswith(".yml") and e.is_file()
+        )
+    _yaml_dir_cache[key] = (mtime_ns, files)
+    return files
+
+
+def _parse_yaml_file(yaml_path: Path) -> Dict[str, Any]:
+    """Parse a YAML translation file without consulting the cache."""
     if RUAMEL_AVAILABLE:
         yaml = get_yaml_instance()
         with open(yaml_path, "r", encoding="utf-8") as f:
@@ -62,6 +115,179 @@ def load_yaml_file(yaml_path: Path) -> Dict[str, Any]:
     return data or {"locale": "", "translations": {}}
 
 
+def _side_cache_dir() -> Optional[str]:
+    """Per-user side-cache directory, or None if disabled or unsafe to use."""
+    if os.environ.get(_SIDE_CACHE_ENV) != "1":
+        return None
+
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    cache_dir = os.path.join(base, "helixscreen", "translations")
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        st = os.lstat(cache_dir)
+    except OSError:
+        return None
+
+    # lstat() so a symlink planted in place of the directory is refused
+    if not stat.S_ISDIR(st.st_mode) or st.st_mode & 0o022:
+        return None
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        return None
+    return cache_dir
+
+
+def _side_cache_path(key: str) -> Optional[str]:
+    """Side-cache file for a YAML path, or None if the cache is unavailable."""
+    cache_dir = _side_cache_dir()
+    if cache_dir is None:
+        return None
+
+    name = f"{_SIDE_CACHE_TAG}\0{os.path.abspath(key)}"
+    digest = hashlib.sha256(name.encode("utf-8", "surrogateescape")).hexdigest()
+    return os.path.join(cache_dir, f"{digest}.marshal")
+
+
+def _plain(obj: Any) -> Any:
+    """Copy parsed YAML as the builtin types marshal accepts.
+
+    ruamel returns subclasses (CommentedMap, ScalarFloat, ...) that marshal
+    rejects. Raises TypeError for anything else, such as timestamps.
+    """
+    if isinstance(obj, dict):
+        return {_plain(k): _plain(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_plain(v) for v in obj]
+    if obj is None:
+        return None
+    for kind in (str, bool, int, float):
+        if isinstance(obj, kind):
+            return kind(obj)
+    raise TypeError(f"cannot cache {type(obj).__name__}")
+
+
+def _read_side_cache(cache_path: str, stamp: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+    """Return the cached parse if it matches stamp, else None."""
+    try:
+        fd = os.open(cache_path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    except OSError:
+        return None
+
+    try:
+        with os.fdopen(fd, "rb") as f:
+            mtime_ns, size, data = marshal.load(f)
+    except Exception:
+        # Truncated, or written by an incompatible version: parse again
+        return None
+
+    return data if (mtime_ns, size) == stamp else None
+
+
+def _write_side_cache(cache_path: str, stamp: Tuple[int, int], data: Dict[str, Any]) -> None:
+    """Atomically replace the cached parse for a YAML path."""
+    try:
+        payload = marshal.dumps((*stamp, _plain(data)))
+    except (TypeError, ValueError):
+        return
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # The side cache is best-effort; never fail a load over it
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _is_round_trip(data: Dict[str, Any]) -> bool:
+    """Whether data can be saved back without losing comments or quoting."""
+    return not RUAMEL_AVAILABLE or isinstance(data, CommentedMap)
+
+
+def load_yaml_file(yaml_path: Path, readonly: bool = False) -> Dict[str, Any]:
+    """
+    Load a YAML translation file.
+
+    Parsed files are cached in-process and revalidated with a stat() of the
+    path, so repeated loads of an unchanged file skip the YAML parser.
+
+    With HELIX_YAML_CACHE=1 in the environment, read-only loads also use a
+    per-user cache under $XDG_CACHE_HOME/helixscreen/translations (default
+    ~/.cache), so later runs can skip the parser too. Each read-only load
+    that parses a file writes its cache entry. Loads for modification
+    always parse, since the cache holds plain data without comments.
+
+    Args:
+        yaml_path: Path to the YAML file
+        readonly: If True, return the shared cached object; the caller must
+            not modify it. Otherwise a private copy is returned.
+
+    Returns:
+        Dict with 'locale' and 'translations' keys
+    """
+    key = os.fspath(yaml_path)
+    st = os.stat(key)
+    stamp = (st.st_mtime_ns, st.st_size)
+
+    cached = _yaml_cache.get(key)
+    if (
+        cached is not None
+        and cached[:2] == stamp
+        and (readonly or _is_round_trip(cached[2]))
+    ):
+        _yaml_cache.move_to_end(key)
+        data = cached[2]
+    else:
+        cache_path = _side_cache_path(key) if readonly else None
+        data = _read_side_cache(cache_path, stamp) if cache_path else None
+        if data is None:
+            data = _parse_yaml_file(yaml_path)
+            if cache_path:
+                _write_side_cache(cache_path, stamp, data)
+        _yaml_cache[key] = (*stamp, data, None)
+        _yaml_cache.move_to_end(key)
+        while len(_yaml_cache) > _YAML_CACHE_MAX:
+            _yaml_cache.popitem(last=False)
+
+    return data if readonly else copy.deepcopy(data)
+
+
+def load_yaml_translation_keys(yaml_path: Union[str, Path]) -> FrozenSet[str]:
+    """
+    Get the set of translation keys in a YAML file.
+
+    The set is built once per parse and shared by every caller. String keys
+    are interned plain strings (ruamel may return str subclasses); keys the
+    YAML parser typed otherwise, such as 1 or true, are kept as loaded.
+
+    Args:
+        yaml_path: Path to the YAML file
+
+    Returns:
+        Frozenset of the keys under 'translations'
+    """
+    key = os.fspath(yaml_path)
+    data = load_yaml_file(yaml_path, readonly=True)
+
+    entry = _yaml_cache[key]
+    if entry[3] is None:
+        keys = frozenset(
+            sys.intern(str(k)) if isinstance(k, str) else k
+            for k in data.get("translations") or {}
+        )
+        entry = (*entry[:3], keys)
+        _yaml_cache[key] = entry
+
+    return entry[3]
+
+
 def save_yaml_file(yaml_path: Path, data: Dict[str, Any]) -> None:
     """
     Save a YAML translation file, preserving formatting.
@@ -70,6 +296,8 @@ def save_yaml_file(yaml_path: Path, data: Dict[str, Any]) -> None:
         yaml_path: Path to the YAML file
         data: Data to save
     """
+    _yaml_cache.pop(os.fspath(yaml_path), None)
+
     if RUAMEL_AVAILABLE:
         yaml = get_yaml_instance()
         with open(yaml_path, "w", encoding="utf-8") as f:
@@ -98,7 +326,7 @@ def merge_new_keys(
     """
     result = MergeResult()
 
-    for yaml_path in yaml_dir.glob("*.yml"):
+    for yaml_path in _list_yaml_files(yaml_dir):
         data = load_yaml_file(yaml_path)
         locale = data.get("locale", yaml_path.stem)
         translations = data.get("translations", {})
@@ -136,23 +364,39 @@ def merge_new_keys(
 
 def merge_new_keys_with_sources(
     yaml_dir: Path,
-    new_keys_with_sources: Dict[str, List[Tuple[str, int]]],
+    new_keys_with_sources: Union[Mapping[str, List[Tuple[str, int]]], Collection[str]],
     dry_run: bool = False,
+    get_sources: Optional[Callable[[str], List[Tuple[str, int]]]] = None,
 ) -> MergeResult:
     """
     Merge new translation keys with source file comments.
 
     Args:
         yaml_dir: Directory containing translation YAML files
-        new_keys_with_sources: Dict mapping keys to list of (filename, line) tuples
+        new_keys_with_sources: Dict mapping keys to list of (filename, line) tuples,
+            or just the new keys, in merge order, when get_sources is given
         dry_run: If True, don't modify files
+        get_sources: Callable returning the (filename, line) tuples for a key.
+            Required unless new_keys_with_sources is a mapping. Only called
+            when a comment is written, so never on dry runs.
 
     Returns:
         MergeResult with statistics
+
+    Raises:
+        TypeError: If new_keys_with_sources is not a mapping and no
+            get_sources is given
     """
+    if get_sources is None:
+        if not isinstance(new_keys_with_sources, Mapping):
+            raise TypeError(
+                "get_sources is required when new keys are not a mapping of sources"
+            )
+        get_sources = new_keys_with_sources.__getitem__
+
     result = MergeResult()
 
-    for yaml_path in yaml_dir.glob("*.yml"):
+    for yaml_path in _list_yaml_files(yaml_dir):
         data = load_yaml_file(yaml_path)
         locale = data.get("locale", yaml_path.stem)
         translations = data.get("translations", {})
@@ -163,7 +407,7 @@ def merge_new_keys_with_sources(
 
         keys_added_to_file = 0
 
-        for key, sources in new_keys_with_sources.items():
+        for key in new_keys_with_sources:
             if key not in translations:
                 if locale == "en":
                     translations[key] = key
@@ -171,8 +415,13 @@ def merge_new_keys_with_sources(
                     translations[key] = ""
                 keys_added_to_file += 1
 
-                # Add source comment if using ruamel.yaml
-                if RUAMEL_AVAILABLE and isinstance(translations, CommentedMap):
+                # Add source comment if using ruamel.yaml (not saved on dry runs)
+                if (
+                    not dry_run
+                    and RUAMEL_AVAILABLE
+                    and isinstance(translations, CommentedMap)
+                ):
+                    sources = get_sources(key)
                     source_str = ", ".join(f"{f}:{l}" for f, l in sources[:3])
                     if len(sources) > 3:
                         source_str += f" (+{len(sources) - 3} more)"
@@ -11,6 +11,8 @@ import json
 import sys
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
 import pytest
 
 # Add scripts directory to path
@@ -27,6 +29,14 @@ RAM_BUCKETS = telemetry_analyze.RAM_BUCKETS
 UPTIME_BUCKETS = telemetry_analyze.UPTIME_BUCKETS
 NOZZLE_TEMP_BUCKETS = telemetry_analyze.NOZZLE_TEMP_BUCKETS
 BED_TEMP_BUCKETS = telemetry_analyze.BED_TEMP_BUCKETS
+bucket_counts = telemetry_analyze.bucket_counts
+round_floats = telemetry_analyze.round_floats
+RAM_EDGES = telemetry_analyze.RAM_EDGES
+RAM_LABELS = telemetry_analyze.RAM_LABELS
+NOZZLE_TEMP_EDGES = telemetry_analyze.NOZZLE_TEMP_EDGES
+NOZZLE_TEMP_LABELS = telemetry_analyze.NOZZLE_TEMP_LABELS
+UPTIME_EDGES = telemetry_analyze.UPTIME_EDGES
+UPTIME_LABELS = telemetry_analyze.UPTIME_LABELS
 
 
 # =============================================================================
@@ -177,6 +187,60 @@ class TestBucketValue:
         assert bucket_value(60, BED_TEMP_BUCKETS) == "60-80C"
 
 
+class TestBucketCounts:
+    """Tests for the vectorized bucket_counts() helper."""
+
+    def test_matches_bucket_value(self):
+        """Each value lands in the same bucket bucket_value() would pick."""
+        values = [0, 256, 511, 512, 1024, 4095, 8192, 16384]
+        counts = bucket_counts(pd.Series(values), RAM_EDGES, RAM_LABELS)
+
+        expected: dict = {}
+        for v in values:
+            label = bucket_value(v, RAM_BUCKETS)
+            expected[label] = expected.get(label, 0) + 1
+        assert counts == expected
+
+    def test_nan_and_negative_are_unknown(self):
+        """NaN and out-of-range values are counted as 'unknown'."""
+        counts = bucket_counts(
+            pd.Series([float("nan"), -5, 1024]), RAM_EDGES, RAM_LABELS
+        )
+        assert counts == {"unknown": 2, "1-2GB": 1}
+
+    def test_edges_are_half_open(self):
+        """Each edge belongs to the bucket above it, as in bucket_value()."""
+        counts = bucket_counts(
+            pd.Series([179.9, 180, 310, float("inf")]),
+            NOZZLE_TEMP_EDGES,
+            NOZZLE_TEMP_LABELS,
+        )
+        assert counts == {
+            "<180C": 1,
+            "180-200C": 1,
+            "310C+": 1,
+            "unknown": 1,
+        }
+
+    def test_ties_keep_first_appearance_order(self):
+        """Equal counts are ordered as bucket_value() + value_counts() does."""
+        values = pd.Series([20000, 30, float("nan"), 600, 30, 20000, 600, None])
+        counts = bucket_counts(values, UPTIME_EDGES, UPTIME_LABELS)
+
+        expected = (
+            values.map(lambda v: bucket_value(v, UPTIME_BUCKETS))
+            .value_counts()
+            .to_dict()
+        )
+        assert list(counts.items()) == list(expected.items())
+        assert list(counts) == ["4hr+", "<1min", "unknown", "5-15min"]
+
+    def test_empty_buckets_omitted(self):
+        """Buckets with no values are left out of the result."""
+        counts = bucket_counts(pd.Series([300.0]), RAM_EDGES, RAM_LABELS)
+        assert counts == {"<512MB": 1}
+
+
 # =============================================================================
 # Test: Event Loading
 # =============================================================================
@@ -215,6 +279,38 @@ class TestLoadEvents:
         assert row["host.arch"] == "x86_64"
         assert row["printer.detected_model"] == "Prusa MK4"
 
+    def test_event_frames_keep_only_their_columns(self, tmp_path):
+        """Per-type frames don't carry other event types' columns."""
+        events = [make_session_event(), make_print_event(), make_crash_event()]
+        write_event_file(tmp_path, events)
+
+        analyzer = TelemetryAnalyzer()
+        analyzer.load_events(str(tmp_path))
+
+        assert "outcome" in analyzer.prints.columns
+        assert "outcome" not in analyzer.sessions.columns
+        assert "app.version" not in analyzer.crashes.columns
+        assert "device_id" in analyzer.crashes.columns
+
+    def test_parses_iso_timestamp_variants(self, tmp_path):
+        """ISO 8601 variants parse to UTC; anything else becomes NaT."""
+        events = [
+            make_session_event(timestamp="2026-02-09T10:00:00Z"),
+            make_session_event(timestamp="2026-02-09T10:00:00.250Z"),
+            make_session_event(timestamp="2026-02-09T12:00:00+02:00"),
+            make_session_event(timestamp="not a timestamp"),
+        ]
+        write_event_file(tmp_path, events)
+
+        analyzer = TelemetryAnalyzer()
+        analyzer.load_events(str(tmp_path))
+
+        ts = analyzer.sessions["timestamp"]
+        assert ts.iloc[0] == pd.Timestamp("2026-02-09T10:00:00Z")
+        assert ts.iloc[1] == pd.Timestamp("2026-02-09T10:00:00.250Z")
+        assert ts.iloc[2] == pd.Timestamp("2026-02-09T10:00:00Z")
+        assert pd.isna(ts.iloc[3])
+
     def test_handles_batch_files(self, tmp_path):
         """JSON files containing arrays of events are handled correctly."""
         batch = [
@@ -255,6 +351,75 @@ class TestLoadEvents:
 
         assert len(analyzer.sessions) == 1
 
+    def test_loads_without_orjson(self, tmp_path, monkeypatch):
+        """The stdlib json fallback loads and skips files the same way."""
+        monkeypatch.setattr(telemetry_analyze, "ORJSON_AVAILABLE", False)
+        event_dir = tmp_path / "2026" / "02" / "09"
+        event_dir.mkdir(parents=True)
+        (event_dir / "good.json").write_text(json.dumps([make_session_event()]))
+        (event_dir / "bad.json").write_text("{not valid json!!!")
+
+        analyzer = TelemetryAnalyzer()
+        analyzer.load_events(str(tmp_path))
+
+        assert len(analyzer.sessions) == 1
+
+    def test_arrow_engine_matches_pandas(self, tmp_path):
+        """engine="arrow" gives the same metrics as the pandas engine."""
+        pytest.importorskip("pyarrow")
+        events = [
+            make_session_event(device_id="dev-a", features=["macros"]),
+            make_session_event(device_id="dev-b", features=[]),
+            make_print_event(device_id="dev-a"),
+            make_crash_event(device_id="dev-b"),
+        ]
+        write_event_file(tmp_path, events)
+
+        results = []
+        for engine in ("pandas", "arrow"):
+            analyzer = TelemetryAnalyzer()
+            analyzer.load_events(str(tmp_path), engine=engine)
+            metrics = analyzer.compute_all()
+            metrics.pop("generated_at", None)
+            results.append(metrics)
+
+        assert results[0] == results[1]
+
+    def test_arrow_flatten_rejects_mixed_field_types(self):
+        """An int/str field fails schema inference and yields None."""
+        pytest.importorskip("pyarrow")
+        events = [
+            make_crash_event(device_id="d1", signal=11),
+            make_crash_event(device_id="d2", signal="SIGSEGV"),
+        ]
+
+        assert telemetry_analyze.flatten_events_arrow(events) is None
+
+    def test_string_columns_use_arrow_strings(self, tmp_path):
+        """With pyarrow installed, listed string fields are Arrow-backed."""
+        pytest.importorskip("pyarrow")
+        write_event_file(tmp_path, [make_print_event(), make_crash_event()])
+
+        analyzer = TelemetryAnalyzer()
+        analyzer.load_events(str(tmp_path))
+
+        assert analyzer.prints["device_id"].dtype == "string[pyarrow]"
+        assert analyzer.prints["outcome"].dtype == "string[pyarrow]"
+        assert analyzer.crashes["signal_name"].dtype == "string[pyarrow]"
+        assert analyzer.compute_print_metrics()["outcome_counts"] == {"success": 1}
+
+    def test_arrow_engine_falls_back_without_pyarrow(self, tmp_path, monkeypatch, capsys):
+        """Without pyarrow, engine="arrow" warns and loads with pandas."""
+        monkeypatch.setattr(telemetry_analyze, "PYARROW_AVAILABLE", False)
+        write_event_file(tmp_path, [make_session_event(), make_crash_event()])
+
+        analyzer = TelemetryAnalyzer()
+        analyzer.load_events(str(tmp_path), engine="arrow")
+
+        assert "pyarrow not installed" in capsys.readouterr().err
+        assert len(analyzer.sessions) == 1
+        assert len(analyzer.crashes) == 1
+
     def test_empty_directory_yields_empty_dataframes(self, tmp_path):
         """Empty data directory results in empty DataFrames."""
         analyzer = TelemetryAnalyzer()
@@ -272,6 +437,27 @@ class TestLoadEvents:
 
         assert analyzer.all_events.empty
 
+    def test_missing_data_dir_skips_pandas_import(self, tmp_path):
+        """main() exits on a missing data dir without importing pandas."""
+        import subprocess
+
+        script = scripts_dir / "telemetry-analyze.py"
+        code = (
+            "import runpy, sys\n"
+            f"sys.argv = ['telemetry-analyze.py', '--data-dir', {str(tmp_path / 'missing')!r}]\n"
+            "try:\n"
+            f"    runpy.run_path({str(script)!r}, run_name='__main__')\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('pandas' in sys.modules, 'numpy' in sys.modules)\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert out.stdout.split() == ["False", "False"]
+        assert "Data directory not found" in out.stderr
+
     def test_since_filter(self, tmp_path):
         """Events before --since date are excluded."""
         events = [
@@ -378,6 +564,23 @@ class TestAdoptionMetrics:
         assert daily["2026-02-08"] == 2
         assert daily["2026-02-09"] == 1
 
+    def test_weekly_active_devices_use_iso_week_labels(self, tmp_path):
+        """Weekly active devices are keyed by ISO week (Monday start)."""
+        events = [
+            # Sunday 2026-02-08 closes ISO week 6; Monday 2026-02-09 opens week 7
+            make_session_event(device_id="d1", timestamp="2026-02-08T10:00:00Z"),
+            make_session_event(device_id="d2", timestamp="2026-02-08T11:00:00Z"),
+            make_session_event(device_id="d1", timestamp="2026-02-09T10:00:00Z"),
+        ]
+        write_event_file(tmp_path, events)
+
+        analyzer = TelemetryAnalyzer()
+        analyzer.load_events(str(tmp_path))
+        result = analyzer.compute_adoption_metrics()
+
+        assert result["active_devices_weekly"] == {"2026-W06": 2, "2026-W07": 1}
+        assert result["active_devices_monthly"] == {"2026-02": 2}
+
     def test_platform_distribution(self, tmp_path):
         """Platform distribution counts each platform occurrence."""
         events = [
@@ -395,6 +598,29 @@ class TestAdoptionMetrics:
         assert dist["linux-aarch64"] == 2
         assert dist["linux-x86_64"] == 1
 
+    def test_distribution_top_keeps_tie_order(self, tmp_path):
+        """Top-N distributions order by count, ties by first appearance."""
+        models = ["Ender 3", "Voron 2.4", "Voron 2.4", "Prusa MK4", "Ender 3"]
+        events = [
+            make_session_event(device_id=f"d{i}", printer_model=model)
+            for i, model in enumerate(models)
+        ]
+        write_event_file(tmp_path, events)
+
+        analyzer = TelemetryAnalyzer()
+        analyzer.load_events(str(tmp_path))
+        sessions = analyzer.sessions
+
+        column = "printer.detected_model"
+        full = analyzer._distribution(sessions, column)
+        assert list(full.items()) == [
+            ("Ender 3", 2),
+            ("Voron 2.4", 2),
+            ("Prusa MK4", 1),
+        ]
+        top = analyzer._distribution(sessions, column, top=2)
+        assert list(top.items()) == list(full.items())[:2]
+
     def test_version_distribution(self, tmp_path):
         """App version distribution counts occurrences per version."""
         events = [
@@ -462,6 +688,22 @@ class TestAdoptionMetrics:
         assert rates["telemetry"] == 100.0
         assert rates["auto_update"] == pytest.approx(66.7, abs=0.1)
 
+    def test_feature_adoption_counts_sessions_without_features(self, tmp_path):
+        """Sessions with no features key count toward the rate denominator."""
+        no_features = make_session_event(device_id="d2")
+        del no_features["features"]
+        events = [
+            make_session_event(device_id="d1", features=["telemetry"]),
+            no_features,
+        ]
+        write_event_file(tmp_path, events)
+
+        analyzer = TelemetryAnalyzer()
+        analyzer.load_events(str(tmp_path))
+        result = analyzer.compute_adoption_metrics()
+
+        assert result["feature_adoption_rates"] == {"telemetry": 50.0}
+
     def test_new_devices_per_day(self, tmp_path):
         """New devices per day tracks first-seen date for each device."""
         events = [
@@ -573,6 +815,21 @@ class TestPrintMetrics:
         by_model = result.get("success_rate_by_model", {})
         assert "RareBot" not in by_model
 
+    def test_success_rate_weekly(self, tmp_path):
+        """Weekly success rate is the share of successful prints per ISO week."""
+        events = [
+            make_print_event(device_id="d1", timestamp="2026-02-03T12:00:00Z", outcome="success"),
+            make_print_event(device_id="d1", timestamp="2026-02-04T12:00:00Z", outcome="failure"),
+            make_print_event(device_id="d1", timestamp="2026-02-10T12:00:00Z", outcome="success"),
+        ]
+        write_event_file(tmp_path, events)
+
+        analyzer = TelemetryAnalyzer()
+        analyzer.load_events(str(tmp_path))
+        result = analyzer.compute_print_metrics()
+
+        assert result["success_rate_weekly"] == {"2026-W06": 50.0, "2026-W07": 100.0}
+
     def test_phase_completion_distribution(self, tmp_path):
         """Phase completion counts how many prints reached each phase."""
         events = [
@@ -676,6 +933,25 @@ class TestPrintMetrics:
         assert by_kin["corexy"]["rate"] == 100.0
         assert by_kin["cartesian"]["rate"] == 0.0
 
+    def test_session_lookup_rebuilt_when_sessions_replaced(self, tmp_path):
+        """Cached session lookups don't outlive the sessions frame."""
+        events = [
+            make_session_event(device_id="d1", kinematics="corexy"),
+            make_print_event(device_id="d1", outcome="success"),
+        ]
+        write_event_file(tmp_path, events)
+
+        analyzer = TelemetryAnalyzer()
+        analyzer.load_events(str(tmp_path))
+        first = analyzer.compute_print_metrics()["success_rate_by_kinematics"]
+        assert list(first) == ["corexy"]
+
+        analyzer.sessions = analyzer.sessions.assign(
+            **{"printer.kinematics": "delta"}
+        )
+        second = analyzer.compute_print_metrics()["success_rate_by_kinematics"]
+        assert list(second) == ["delta"]
+
 
 # =============================================================================
 # Test: Crash Metrics
@@ -748,6 +1024,23 @@ class TestCrashMetrics:
         assert rates["1.0.0"] == 1.0  # 2 crashes / 2 sessions
         assert rates["1.1.0"] == 1.0  # 1 crash / 1 session
 
+    def test_crash_rate_per_version_without_sessions_is_none(self, tmp_path):
+        """A crashing version with no sessions gets a None rate."""
+        events = [
+            make_session_event(device_id="d1", version="1.0.0"),
+            make_crash_event(device_id="d1", app_version="1.0.0"),
+            make_crash_event(device_id="d1", app_version="0.9.0"),
+        ]
+        write_event_file(tmp_path, events)
+
+        analyzer = TelemetryAnalyzer()
+        analyzer.load_events(str(tmp_path))
+        result = analyzer.compute_crash_metrics()
+
+        rates = result["crash_rate_per_version"]
+        assert rates["1.0.0"] == 1.0
+        assert rates["0.9.0"] is None
+
     def test_uptime_bucketing(self, tmp_path):
         """Uptime before crash is bucketed into labeled ranges."""
         events = [
@@ -800,6 +1093,29 @@ class TestCrashMetrics:
         assert by_platform["linux-aarch64"] == 1
         assert by_platform["linux-x86_64"] == 1
 
+    def test_crashes_by_platform_skips_sessions_without_platform(self, tmp_path):
+        """A device's first session without a platform doesn't mask a later one."""
+        first = make_session_event(
+            device_id="d1", timestamp="2026-02-09T08:00:00Z"
+        )
+        del first["app"]["platform"]
+        events = [
+            first,
+            make_session_event(
+                device_id="d1",
+                timestamp="2026-02-09T09:00:00Z",
+                platform="linux-aarch64",
+            ),
+            make_crash_event(device_id="d1"),
+        ]
+        write_event_file(tmp_path, events)
+
+        analyzer = TelemetryAnalyzer()
+        analyzer.load_events(str(tmp_path))
+        result = analyzer.compute_crash_metrics()
+
+        assert result["crashes_by_platform"] == {"linux-aarch64": 1}
+
     def test_crashes_by_version(self, tmp_path):
         """Crashes are grouped by app_version field."""
         events = [
@@ -819,6 +1135,53 @@ class TestCrashMetrics:
         assert by_ver["1.1.0"] == 1
 
 
+# =============================================================================
+# Test: Panel Usage Metrics
+# =============================================================================
+
+
+class TestPanelUsageMetrics:
+    """Tests for TelemetryAnalyzer.compute_panel_usage_metrics()."""
+
+    def test_no_panel_usage_returns_note(self):
+        """Empty panel usage DataFrame returns a note."""
+        analyzer = TelemetryAnalyzer()
+        result = analyzer.compute_panel_usage_metrics()
+        assert result == {"note": "No panel usage data"}
+
+    def test_panel_totals_summed_and_sorted(self, tmp_path):
+        """Per-panel time and visits are summed across sessions, largest first."""
+        events = [
+            {
+                "event": "panel_usage",
+                "device_id": "d1",
+                "timestamp": "2026-02-09T10:00:00Z",
+                "session_duration_sec": 600,
+                "panel_time_sec": {"home": 100, "controls": 300},
+                "panel_visits": {"home": 4, "controls": 1},
+            },
+            {
+                "event": "panel_usage",
+                "device_id": "d2",
+                "timestamp": "2026-02-09T11:00:00Z",
+                "session_duration_sec": 1200,
+                "panel_time_sec": {"home": 50, "files": 20},
+                "panel_visits": {"home": 2},
+            },
+        ]
+        write_event_file(tmp_path, events)
+
+        analyzer = TelemetryAnalyzer()
+        analyzer.load_events(str(tmp_path))
+        result = analyzer.compute_panel_usage_metrics()
+
+        time_by_panel = result["total_time_by_panel_sec"]
+        assert time_by_panel == {"controls": 300, "home": 150, "files": 20}
+        assert list(time_by_panel) == ["controls", "home", "files"]
+        assert result["total_visits_by_panel"] == {"home": 6, "controls": 1}
+        assert result["avg_session_duration_sec"] == 900.0
+
+
 # =============================================================================
 # Test: Edge Cases
 # =============================================================================
@@ -860,6 +1223,28 @@ class TestEdgeCases:
 
         assert result == {"note": "No print data"}
 
+    def test_print_start_bool_pct_ignores_missing(self, tmp_path):
+        """Boolean percentages are taken over events that report the field."""
+        base = {
+            "schema_version": 2,
+            "event": "print_start_context",
+            "device_id": "dev-001",
+            "timestamp": "2026-02-09T10:00:00Z",
+        }
+        events = [
+            {**base, "has_thumbnail": True, "ams_active": False},
+            {**base, "has_thumbnail": False, "ams_active": False},
+            {**base, "has_thumbnail": True},
+        ]
+        write_event_file(tmp_path, events)
+
+        analyzer = TelemetryAnalyzer()
+        analyzer.load_events(str(tmp_path))
+        result = analyzer.compute_print_start_metrics()
+
+        assert result["thumbnail_pct"] == pytest.approx(66.7)
+        assert result["ams_active_pct"] == 0.0
+
     def test_crash_with_no_sessions(self, tmp_path):
         """Crash metrics handle case where there are crashes but no sessions."""
         events = [make_crash_event()]
@@ -896,6 +1281,18 @@ class TestEdgeCases:
         assert result["event_counts"]["crashes"] == 1
         assert result["event_counts"]["total"] == 3
 
+    def test_event_counts_follow_assigned_frames(self, tmp_path):
+        """event_counts reflects frames assigned after load_events()."""
+        write_event_file(tmp_path, [make_session_event(), make_crash_event()])
+
+        analyzer = TelemetryAnalyzer()
+        analyzer.load_events(str(tmp_path))
+        analyzer.crashes = analyzer.crashes.iloc[:0]
+        result = analyzer.compute_all()
+
+        assert result["event_counts"]["sessions"] == 1
+        assert result["event_counts"]["crashes"] == 0
+
     def test_empty_features_list(self, tmp_path):
         """Sessions with empty features list produce 0% adoption rates."""
         events = [make_session_event(features=[])]
@@ -930,6 +1327,67 @@ class TestEdgeCases:
         assert len(analyzer.all_events) == 6
 
 
+class TestRoundFloats:
+    """Tests for the compute_all() rounding pass."""
+
+    def test_rounds_all_floats_to_one_place(self):
+        """numpy and Python floats alike are rounded to 1 place."""
+        metrics = {
+            "a": {"mean": np.float64(123.456), "rate": 0.1234},
+            "b": [np.float32(2.25), 3],
+        }
+        assert round_floats(metrics) == {
+            "a": {"mean": 123.5, "rate": 0.1},
+            "b": [2.2, 3],
+        }
+
+    def test_precision_applies_to_nested_values(self):
+        """A key listed in the precision table sets it for its whole value."""
+        metrics = {
+            "crash_rate": 0.123456,
+            "crash_rate_per_version": {"1.0.0": np.float64(0.654321)},
+            "other": 0.123456,
+        }
+        assert round_floats(metrics) == {
+            "crash_rate": 0.1235,
+            "crash_rate_per_version": {"1.0.0": 0.6543},
+            "other": 0.1,
+        }
+
+    def test_compute_methods_return_rounded_values(self, tmp_path):
+        """Direct compute_*_metrics() callers get rounded Python floats."""
+        base = {
+            "schema_version": 2,
+            "event": "connection_stability",
+            "timestamp": "2026-02-09T10:00:00Z",
+        }
+        events = [
+            {**base, "device_id": "d1", "connect_count": 1},
+            {**base, "device_id": "d2", "connect_count": 1},
+            {**base, "device_id": "d3", "connect_count": 2},
+        ]
+        write_event_file(tmp_path, events)
+
+        analyzer = TelemetryAnalyzer()
+        analyzer.load_events(str(tmp_path))
+        result = analyzer.compute_connection_metrics()
+
+        assert result["connect_count_mean"] == 1.33
+        assert type(result["connect_count_mean"]) is float
+
+    def test_compute_all_values_are_python_floats(self, tmp_path):
+        """Metric values reaching the formatters are plain, rounded floats."""
+        events = [make_crash_event(uptime_sec=100), make_crash_event(uptime_sec=1)]
+        write_event_file(tmp_path, events)
+
+        analyzer = TelemetryAnalyzer()
+        analyzer.load_events(str(tmp_path))
+        crash = analyzer.compute_all()["crash_analysis"]
+
+        assert crash["mean_uptime_before_crash_sec"] == 50.5
+        assert type(crash["mean_uptime_before_crash_sec"]) is float
+
+
 # =============================================================================
 # Test: Output Formatters
 # =============================================================================
@@ -967,6 +1425,40 @@ class TestOutputFormatters:
         assert "adoption" in parsed
         assert "print_reliability" in parsed
 
+    def test_format_json_same_without_orjson(self, tmp_path, monkeypatch):
+        """The stdlib json fallback renders the same document."""
+        events = [make_session_event(), make_print_event(), make_crash_event()]
+        write_event_file(tmp_path, events)
+
+        analyzer = TelemetryAnalyzer()
+        analyzer.load_events(str(tmp_path))
+        metrics = analyzer.compute_all()
+        fast = analyzer.format_json(metrics)
+        monkeypatch.setattr(telemetry_analyze, "ORJSON_AVAILABLE", False)
+        slow = analyzer.format_json(metrics)
+
+        assert json.loads(fast) == json.loads(slow)
+
+    def test_format_json_encoders_agree(self, monkeypatch):
+        """orjson and json write identical text for non-ASCII, NaN and numpy."""
+        pytest.importorskip("orjson")
+        metrics = {
+            "generated_at": "2026-02-09T00:00:00+00:00",
+            "locale_distribution": {"日本語": 3, "Français": np.int64(2)},
+            "crash_rate": float("nan"),
+            "peak": np.float64(float("inf")),
+            "by_code": {1: 0.5, None: True},
+        }
+        analyzer = TelemetryAnalyzer()
+        monkeypatch.setattr(telemetry_analyze, "ORJSON_AVAILABLE", True)
+        fast = analyzer.format_json(metrics)
+        monkeypatch.setattr(telemetry_analyze, "ORJSON_AVAILABLE", False)
+        slow = analyzer.format_json(metrics)
+
+        assert fast == slow
+        assert json.loads(fast)["crash_rate"] is None
+        assert "日本語" in fast
+
     def test_format_html_creates_file(self, tmp_path):
         """HTML output writes a file with expected structure."""
         events = [make_session_event()]
@@ -985,6 +1477,40 @@ class TestOutputFormatters:
         assert "tab-summary" in content
         assert "tab-json" in content
 
+    def test_main_html_renders_terminal_once(
+        self, tmp_path, monkeypatch, capsys
+    ):
+        """--html reuses one terminal render for the file and stdout."""
+        write_event_file(tmp_path, [make_session_event(), make_print_event()])
+        html_path = tmp_path / "report.html"
+
+        calls = []
+        render = TelemetryAnalyzer.format_terminal
+
+        def counting_render(self, metrics):
+            calls.append(metrics)
+            return render(self, metrics)
+
+        monkeypatch.setattr(
+            TelemetryAnalyzer, "format_terminal", counting_render
+        )
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                "telemetry-analyze.py",
+                "--data-dir",
+                str(tmp_path),
+                "--html",
+                str(html_path),
+            ],
+        )
+        telemetry_analyze.main()
+
+        assert len(calls) == 1
+        assert "HELIXSCREEN TELEMETRY REPORT" in capsys.readouterr().out
+        assert html_path.exists()
+
     def test_fmt_duration_seconds(self):
         """Duration formatter handles seconds."""
         assert TelemetryAnalyzer._fmt_duration(45) == "45s"
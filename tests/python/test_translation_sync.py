@@ -24,6 +24,13 @@ FIXTURES_DIR = Path(__file__).parent / "fixtures" / "translation_sync"
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep the opt-in YAML side-cache off and out of the real cache directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.delenv("HELIX_YAML_CACHE", raising=False)
+
+
 @pytest.fixture
 def sample_xml_path():
     """Path to sample XML fixture."""
@@ -291,6 +298,37 @@ class TestExtractFromDirectory:
         assert "Main" in result
         assert "Subdir" in result
 
+    def test_xml_and_cpp_share_string_objects(self, tmp_path):
+        """The same text from XML and C++ is returned as one shared object."""
+        xml_path = tmp_path / "panel.xml"
+        xml_path.write_text('<component><text_body text="Shared Label"/></component>')
+
+        cpp_path = tmp_path / "panel.cpp"
+        cpp_path.write_text('lv_label_set_text(label, lv_tr("Shared Label"));\n')
+
+        from translations.extractor import extract_strings_from_cpp, extract_strings_from_xml
+
+        (from_xml,) = extract_strings_from_xml(xml_path)
+        (from_cpp,) = extract_strings_from_cpp(cpp_path)
+
+        assert from_xml == "Shared Label"
+        assert from_xml is from_cpp
+
+    def test_extract_options_tag_entries(self, tmp_path):
+        """Each options_tag entry is extracted, with and without locations."""
+        xml_path = tmp_path / "panel.xml"
+        xml_path.write_text(
+            '<component><dropdown options_tag="Low&#10;High"/></component>'
+        )
+
+        from translations.extractor import (
+            extract_strings_from_xml,
+            extract_strings_with_all_locations,
+        )
+
+        assert {"Low", "High"} <= extract_strings_from_xml(xml_path)
+        assert {"Low", "High"} <= set(extract_strings_with_all_locations(tmp_path))
+
 
 class TestExtractSpecialCharacters:
     """Test handling of special characters in text."""
@@ -412,6 +450,47 @@ class TestYamlSourceComments:
         # Should have comment with source info
         assert "panel_a.xml" in en_content or "New String" in en_content
 
+    def test_sources_not_looked_up_on_dry_run(self, sample_yaml_dir):
+        """A lazy source lookup is skipped when nothing is written."""
+        from translations.yaml_manager import merge_new_keys_with_sources
+
+        def get_sources(key):
+            raise AssertionError(f"sources looked up for {key!r}")
+
+        result = merge_new_keys_with_sources(
+            sample_yaml_dir, {"New String"}, dry_run=True, get_sources=get_sources
+        )
+
+        assert result.keys_added == 2
+
+    def test_sources_looked_up_when_writing(self, sample_yaml_dir):
+        """Keys plus a source callable are merged and written to every file."""
+        from translations.yaml_manager import merge_new_keys_with_sources
+
+        looked_up = []
+
+        def get_sources(key):
+            looked_up.append(key)
+            return [("panel.xml", 7)]
+
+        result = merge_new_keys_with_sources(
+            sample_yaml_dir, ["Zeta", "Alpha"], get_sources=get_sources
+        )
+
+        assert result.keys_added == 4
+        assert result.files_modified == 2
+        assert "Zeta" in (sample_yaml_dir / "en.yml").read_text()
+        assert "Alpha" in (sample_yaml_dir / "de.yml").read_text()
+        if looked_up:  # only with ruamel.yaml, which writes comments
+            assert sorted(looked_up) == ["Alpha", "Alpha", "Zeta", "Zeta"]
+
+    def test_keys_without_get_sources_rejected(self, sample_yaml_dir):
+        """Plain keys need a source callable, even on a dry run."""
+        from translations.yaml_manager import merge_new_keys_with_sources
+
+        with pytest.raises(TypeError, match="get_sources"):
+            merge_new_keys_with_sources(sample_yaml_dir, ["New String"], dry_run=True)
+
 
 class TestYamlFormatPreservation:
     """Test that YAML formatting is preserved."""
@@ -463,6 +542,135 @@ class TestYamlDryRun:
         assert (sample_yaml_dir / "en.yml").read_text() == original_en
 
 
+class TestYamlLoadCache:
+    """Test the in-process cache behind load_yaml_file."""
+
+    def test_dry_run_merge_does_not_leak_into_cache(self, sample_yaml_dir):
+        """Mutating a loaded copy leaves later loads untouched."""
+        from translations.yaml_manager import merge_new_keys, load_yaml_file
+
+        merge_new_keys(sample_yaml_dir, {"New Key"}, dry_run=True)
+
+        data = load_yaml_file(sample_yaml_dir / "en.yml", readonly=True)
+        assert "New Key" not in data["translations"]
+
+    def test_reloads_after_file_changes(self, sample_yaml_dir):
+        """A rewritten file is parsed again instead of served from cache."""
+        from translations.yaml_manager import load_yaml_file
+
+        en_path = sample_yaml_dir / "en.yml"
+        first = load_yaml_file(en_path, readonly=True)
+        assert load_yaml_file(en_path, readonly=True) is first
+
+        en_path.write_text(dedent("""\
+            locale: en
+            translations:
+              "Only Key": "Only Key"
+        """))
+
+        data = load_yaml_file(en_path, readonly=True)
+        assert list(data["translations"]) == ["Only Key"]
+
+    def test_translation_keys_shared(self, sample_yaml_dir):
+        """The key set is built once per parse and shared between callers."""
+        from translations.yaml_manager import load_yaml_translation_keys
+
+        en_path = sample_yaml_dir / "en.yml"
+        keys = load_yaml_translation_keys(en_path)
+
+        assert keys == {"Print Files", "Settings", "Existing Key"}
+        assert load_yaml_translation_keys(en_path) is keys
+
+    def test_translation_keys_keep_non_string_keys(self, sample_yaml_dir):
+        """Keys the YAML parser types as non-strings are not coerced."""
+        from translations.yaml_manager import load_yaml_file, load_yaml_translation_keys
+
+        en_path = sample_yaml_dir / "en.yml"
+        en_path.write_text(dedent("""\
+            locale: en
+            translations:
+              1: "One"
+              "2": "Two"
+        """))
+
+        keys = load_yaml_translation_keys(en_path)
+
+        assert keys == set(load_yaml_file(en_path)["translations"])
+        assert keys == {1, "2"}
+
+    def test_side_cache_survives_new_process(self, sample_yaml_dir, monkeypatch):
+        """With HELIX_YAML_CACHE=1 a fresh in-process cache is filled from disk."""
+        from collections import OrderedDict
+
+        from translations import yaml_manager
+
+        monkeypatch.setenv("HELIX_YAML_CACHE", "1")
+        en_path = sample_yaml_dir / "en.yml"
+        first = yaml_manager.load_yaml_file(en_path, readonly=True)
+
+        def parse(path):
+            raise AssertionError(f"{path} parsed again")
+
+        monkeypatch.setattr(yaml_manager, "_yaml_cache", OrderedDict())
+        monkeypatch.setattr(yaml_manager, "_parse_yaml_file", parse)
+
+        assert yaml_manager.load_yaml_file(en_path, readonly=True) == first
+
+    def test_side_cache_off_by_default(self, sample_yaml_dir, tmp_path):
+        """Nothing is written to the cache directory unless opted in."""
+        from translations.yaml_manager import load_yaml_file
+
+        load_yaml_file(sample_yaml_dir / "en.yml", readonly=True)
+
+        assert not (tmp_path / "cache").exists()
+
+    def test_side_cache_not_used_for_writable_loads(self, sample_yaml_dir, tmp_path, monkeypatch):
+        """Loads for modification parse the file and write no cache entry."""
+        from translations.yaml_manager import load_yaml_file
+
+        monkeypatch.setenv("HELIX_YAML_CACHE", "1")
+        load_yaml_file(sample_yaml_dir / "en.yml")
+
+        assert not list((tmp_path / "cache").rglob("*.marshal"))
+
+    def test_side_cache_rejects_symlinked_dir(self, sample_yaml_dir, tmp_path, monkeypatch):
+        """A symlink in place of the cache directory is never followed."""
+        from collections import OrderedDict
+
+        from translations import yaml_manager
+
+        monkeypatch.setenv("HELIX_YAML_CACHE", "1")
+        target = tmp_path / "elsewhere"
+        target.mkdir(mode=0o700)
+        (tmp_path / "cache" / "helixscreen").mkdir(parents=True)
+        (tmp_path / "cache" / "helixscreen" / "translations").symlink_to(target)
+
+        en_path = sample_yaml_dir / "en.yml"
+        yaml_manager.load_yaml_file(en_path, readonly=True)
+        assert not any(target.iterdir())
+
+        parsed = []
+        monkeypatch.setattr(yaml_manager, "_yaml_cache", OrderedDict())
+        monkeypatch.setattr(
+            yaml_manager,
+            "_parse_yaml_file",
+            lambda path: parsed.append(path) or {"locale": "en", "translations": {}},
+        )
+        yaml_manager.load_yaml_file(en_path, readonly=True)
+        assert parsed == [en_path]
+
+    def test_listing_sees_new_locale(self, sample_yaml_dir):
+        """A locale file added after the first listing is picked up."""
+        from translations.yaml_manager import _list_yaml_files
+
+        assert len(_list_yaml_files(sample_yaml_dir)) == 2
+
+        (sample_yaml_dir / "fr.yml").write_text("locale: fr\ntranslations: {}\n")
+
+        names = {p.name for p in _list_yaml_files(sample_yaml_dir)}
+        assert names == {"en.yml", "de.yml", "fr.yml"}
+
+
 # =============================================================================
 # Test: Coverage Module
 # =============================================================================
@@ -491,6 +699,24 @@ class TestCoverageStats:
 
         assert result["en"]["percentage"] == 100.0
 
+    def test_coverage_iter_yields_each_language(self, sample_yaml_dir):
+        """calculate_coverage_iter() yields (locale, stats) pairs one at a time."""
+        from translations.coverage import calculate_coverage_iter
+
+        it = calculate_coverage_iter(sample_yaml_dir)
+        locale, stats = next(it)
+        rest = dict(it)
+
+        assert locale not in rest
+        rest[locale] = stats
+        assert rest["en"]["percentage"] == 100.0
+        assert rest["de"] == {
+            "total": 3,
+            "translated": 2,
+            "missing": 1,
+            "percentage": 66.7,
+        }
+
     def test_identify_missing_translations(self, sample_yaml_dir):
         """Identifies which keys are missing translations."""
         from translations.coverage import get_missing_translations
@@ -564,6 +790,35 @@ class TestObsoleteDetection:
         assert "Another Unused" in result
         assert "Used Key" not in result
 
+    def test_precomputed_source_keys(self, tmp_path):
+        """Precomputed source strings are used instead of rescanning."""
+        yaml_dir = tmp_path / "translations"
+        yaml_dir.mkdir()
+
+        (yaml_dir / "en.yml").write_text(dedent("""\
+            locale: en
+            translations:
+              "Used Key": "Used"
+              "Obsolete Key": "This is obsolete"
+        """))
+
+        from translations.obsolete import find_obsolete_keys
+
+        # The XML directory does not exist; it must not be scanned
+        result = find_obsolete_keys(
+            tmp_path / "missing", yaml_dir, source_keys={"Used Key"}
+        )
+
+        assert result == {"Obsolete Key"}
+
+        count = find_obsolete_keys(
+            tmp_path / "missing",
+            yaml_dir,
+            source_keys={"Used Key"},
+            count_only=True,
+        )
+        assert count == 1
+
 
 class TestObsoleteActions:
     """Test actions for handling obsolete keys."""
@@ -688,6 +943,76 @@ class TestCliSyncCommand:
         # But file unchanged
         assert (yaml_dir / "en.yml").read_text() == original_yaml
 
+    def test_sync_with_supplied_existing_keys(self, tmp_path):
+        """Caller-supplied base keys stand in for reading the base file."""
+        yaml_dir = tmp_path / "translations"
+        yaml_dir.mkdir()
+
+        (yaml_dir / "en.yml").write_text(dedent("""\
+            locale: en
+            translations:
+              "Existing": "Existing"
+        """))
+
+        xml_dir = tmp_path / "ui_xml"
+        xml_dir.mkdir()
+
+        (xml_dir / "panel.xml").write_text(dedent("""\
+            <?xml version="1.0"?>
+            <component>
+              <text_body text="Existing"/>
+              <text_body text="New String"/>
+            </component>
+        """))
+
+        from translations.cli import run_sync
+
+        result = run_sync(
+            xml_dir, yaml_dir, dry_run=True, existing_keys={"Existing", "New String"}
+        )
+
+        assert result.new_keys_found == 0
+
+    def test_sync_with_sources_merges_in_extraction_order(self, tmp_path, monkeypatch):
+        """New keys reach the merge in source order, not set order."""
+        yaml_dir = tmp_path / "translations"
+        yaml_dir.mkdir()
+
+        (yaml_dir / "en.yml").write_text(dedent("""\
+            locale: en
+            translations:
+              "Existing": "Existing"
+        """))
+
+        xml_dir = tmp_path / "ui_xml"
+        xml_dir.mkdir()
+
+        (xml_dir / "panel.xml").write_text(dedent("""\
+            <?xml version="1.0"?>
+            <component>
+              <text_body text="Zeta"/>
+              <text_body text="Existing"/>
+              <text_body text="Alpha"/>
+              <text_body text="Mid"/>
+              <text_body text="Beta"/>
+            </component>
+        """))
+
+        import translations.cli as cli
+
+        real_merge = cli.merge_new_keys_with_sources
+        merged = []
+
+        def recording_merge(yaml_dir, new_keys, **kwargs):
+            merged.append(new_keys)
+            return real_merge(yaml_dir, new_keys, **kwargs)
+
+        monkeypatch.setattr(cli, "merge_new_keys_with_sources", recording_merge)
+
+        cli.run_sync(xml_dir, yaml_dir, dry_run=True, with_sources=True)
+
+        assert merged == [["Zeta", "Alpha", "Mid", "Beta"]]
+
 
 class TestCliExtractCommand:
     """Test the extract-only command."""
@@ -748,6 +1073,14 @@ class TestCliCoverageCommand:
         result = run_coverage(yaml_dir, fail_under=30)
         assert result.passed
 
+        assert not result.truncated
+
+        # Fail fast reports the same verdict, flagged as partial
+        result = run_coverage(yaml_dir, fail_under=100, fail_fast=True)
+        assert not result.passed
+        assert result.truncated
+        assert result.min_coverage == pytest.approx(33.3)
+
 
 class TestCliObsoleteCommand:
     """Test the obsolete detection command."""
@@ -780,7 +1113,8 @@ class TestCliObsoleteCommand:
 
         # Delete action with dry_run
         result = run_obsolete(xml_dir, yaml_dir, action="delete", dry_run=True)
-        assert result.would_delete > 0
+        assert result.would_delete == 1
+        assert "Unused" in (yaml_dir / "en.yml").read_text()
 
 
 # =============================================================================